@@ -1,6 +1,7 @@
 """Configuration settings for the backend"""
 
 import os
+import tempfile
 from typing import Optional
 
 class Settings:
@@ -21,6 +22,52 @@ class Settings:
     # Database (optional - for future use)
     DATABASE_URL: Optional[str] = None
     
+    # Shared result cache (memory-mapped file shared by all workers on a host)
+    SHARED_CACHE_ENABLED: bool = os.getenv("SHARED_CACHE_ENABLED", "True") == "True"
+    SHARED_CACHE_PATH: str = os.getenv(
+        "SHARED_CACHE_PATH",
+        os.path.join(tempfile.gettempdir(), "quantum_readiness_cache.bin")
+    )
+    SHARED_CACHE_SLOTS: int = int(os.getenv("SHARED_CACHE_SLOTS", "4096"))
+    SHARED_CACHE_SLOT_SIZE: int = int(os.getenv("SHARED_CACHE_SLOT_SIZE", "8192"))
+    
+    # Durable application data (analytics snapshots, results log)
+    DATA_DIR: str = os.getenv(
+        "DATA_DIR",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+    )
+    
+    # Portfolio analytics snapshots (merged across workers)
+    ANALYTICS_SNAPSHOT_PATH: str = os.getenv(
+        "ANALYTICS_SNAPSHOT_PATH",
+        os.path.join(DATA_DIR, "analytics.json")
+    )
+    ANALYTICS_SNAPSHOT_EVERY: int = int(os.getenv("ANALYTICS_SNAPSHOT_EVERY", "100"))
+    
+    # Append-only log of flattened results for bulk export
+    RESULTS_LOG_PATH: str = os.getenv(
+        "RESULTS_LOG_PATH",
+        os.path.join(DATA_DIR, "results.jsonl")
+    )
+    
+    # Versioned scoring rules, re-read when the file changes
+    SCORING_RULES_PATH: str = os.getenv(
+        "SCORING_RULES_PATH",
+        os.path.join(os.path.dirname(__file__), "rules", "scoring_rules.json")
+    )
+    SCORING_RULES_CHECK_INTERVAL: float = float(os.getenv("SCORING_RULES_CHECK_INTERVAL", "2.0"))
+    
+    # Structured request log (sampled, queued, written by a background thread)
+    REQUEST_LOG_ENABLED: bool = os.getenv("REQUEST_LOG_ENABLED", "True") == "True"
+    REQUEST_LOG_DIR: str = os.getenv(
+        "REQUEST_LOG_DIR",
+        os.path.join(tempfile.gettempdir(), "quantum_readiness_requests")
+    )
+    REQUEST_LOG_SAMPLE_RATE: float = float(os.getenv("REQUEST_LOG_SAMPLE_RATE", "1.0"))
+    REQUEST_LOG_QUEUE_SIZE: int = int(os.getenv("REQUEST_LOG_QUEUE_SIZE", "10000"))
+    REQUEST_LOG_MAX_BYTES: int = int(os.getenv("REQUEST_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+    REQUEST_LOG_BACKUPS: int = int(os.getenv("REQUEST_LOG_BACKUPS", "5"))
+    
     # Debug mode
     DEBUG: bool = os.getenv("DEBUG", "False") == "True"
 
@@ -1,7 +1,24 @@
-from fastapi import FastAPI, Request, Body, HTTPException
+from fastapi import FastAPI, Request, Body, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from app.services.scoring import analyze_company
+from fastapi.responses import JSONResponse, StreamingResponse
+from app.services.scoring import (
+    analyze_company,
+    finish_analysis,
+    iter_quantum_simulation,
+    normalize_input,
+    partial_result,
+    reanalyze_company,
+    score_sections
+)
+from app.services.quantum_engine import MAX_STREAM_SHOTS, STREAM_BATCHES, STREAM_SHOTS
+from app.services.rules import get_rules, rules_registry
+from app.services.analysis_store import analysis_store, input_hash
+from app.services.analytics import analytics_recorder
+from app.services.results_export import MEDIA_TYPES, iter_export, results_log
+from app.services import request_log
+from app.services.request_log import RequestLogMiddleware, request_logger
+from app.config import settings
 
 app = FastAPI(title="Quantum Readiness Analyzer")
 
@@ -13,6 +30,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(RequestLogMiddleware, logger=request_logger)
+
 REQUIRED_FIELDS = [
     "problem_type",
     "scale",
@@ -34,7 +53,214 @@ from fastapi import Body
 @app.post("/analyze")
 async def analyze(data: dict = Body(...)):
     try:
-        result = analyze_company(data)
-        return result
+        with request_log.stage("normalize"):
+            inputs = normalize_input(data)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid input")
+
+    key = input_hash(inputs)
+    request_log.annotate(input_hash=key, rules_version=inputs["rules_version"])
+
+    with request_log.stage("cache_lookup"):
+        cached = analysis_store.get(key)
+    if cached is not None:
+        request_log.annotate(cache="hit", simulation_mode=_simulation_mode(cached[1]))
+        return cached[1]
+
+    request_log.annotate(cache="miss")
+    try:
+        # Noisy simulations take up to the latency budget: keep them off the event loop
+        with request_log.stage("analyze"):
+            result = await run_in_threadpool(analyze_company, inputs)
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid input")
+
+    with request_log.stage("record"):
+        analysis_store.save(inputs, result)
+        _record_result(inputs, result)
+    request_log.annotate(simulation_mode=_simulation_mode(result))
+    return result
+
+
+@app.post("/analyze/incremental")
+async def analyze_incremental(payload: dict = Body(...)):
+    """
+    Re-analyzes a previous analysis (by previous_analysis_id, or by
+    previous_input) with the fields in diff changed, recomputing only
+    the sections those fields affect.
+    """
+    diff = payload.get("diff") or {}
+
+    if payload.get("previous_analysis_id"):
+        entry = analysis_store.get(payload["previous_analysis_id"])
+        if entry is None:
+            raise HTTPException(status_code=404, detail="Unknown analysis_id")
+        previous_data, previous_result = entry
+
+    elif payload.get("previous_input") is not None:
+        previous_data = payload["previous_input"]
+        try:
+            entry = analysis_store.get(input_hash(normalize_input(previous_data)))
+        except Exception:
+            raise HTTPException(status_code=400, detail="Invalid input")
+        previous_result = entry[1] if entry else None
+
+    else:
+        raise HTTPException(
+            status_code=400,
+            detail="previous_analysis_id or previous_input is required"
+        )
+
+    try:
+        inputs = normalize_input({**previous_data, **diff})
+        with request_log.stage("analyze"):
+            result = await run_in_threadpool(
+                reanalyze_company, previous_data, previous_result, diff, inputs
+            )
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid input")
+
+    stored = {key: value for key, value in result.items() if key != "incremental"}
+    with request_log.stage("record"):
+        result["analysis_id"] = analysis_store.save(inputs, stored)
+        _record_result(inputs, result)
+
+    request_log.annotate(
+        input_hash=input_hash(inputs),
+        rules_version=inputs["rules_version"],
+        cache="incremental" if previous_result is not None else "miss",
+        simulation_mode=_simulation_mode(result)
+    )
+    return result
+
+
+@app.websocket("/ws/analyze")
+async def analyze_stream(websocket: WebSocket):
+    """
+    Streams one analysis: a "scores" message with every deterministic
+    section, "simulation" messages with cumulative shot counts as the
+    simulation runs in batches, then "complete" with the full result.
+    """
+    await websocket.accept()
+
+    try:
+        data = await websocket.receive_json()
+        inputs = normalize_input(data)
+        shots = int(data.get("shots", STREAM_SHOTS))
+        if not 0 < shots <= MAX_STREAM_SHOTS:
+            raise ValueError("shots out of range")
+        values = score_sections(inputs)
+    except WebSocketDisconnect:
+        return
+    except Exception:
+        await _send_error(websocket, "Invalid input", 1003)
+        return
+
+    try:
+        await websocket.send_json({"type": "scores", "data": partial_result(values)})
+
+        cached = analysis_store.get(input_hash(inputs))
+        if cached is not None:
+            await websocket.send_json({"type": "complete", "data": cached[1]})
+            await websocket.close()
+            return
+
+        simulation = None
+        batches = iter_quantum_simulation(
+            inputs,
+            values["suitability_score"],
+            shots,
+            max(shots // STREAM_BATCHES, 1)
+        )
+        # Each Aer batch runs in the threadpool so the event loop stays free
+        while True:
+            update = await run_in_threadpool(next, batches, None)
+            if update is None:
+                break
+            simulation = update
+            await websocket.send_json({"type": "simulation", "data": simulation})
+
+        result = finish_analysis(values, simulation)
+        analysis_store.save(inputs, result)
+        _record_result(inputs, result)
+
+        await websocket.send_json({"type": "complete", "data": result})
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        return
+    except Exception:
+        # Input was validated above, so anything here is a server-side failure
+        await _send_error(websocket, "Analysis failed", 1011)
+
+
+async def _send_error(websocket: WebSocket, detail: str, code: int):
+    """Reports an error and closes, unless the client has already gone."""
+    try:
+        await websocket.send_json({"type": "error", "detail": detail})
+        await websocket.close(code=code)
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+
+
+def _record_result(inputs: dict, result: dict):
+    # Best-effort: a full disk must not fail an analysis that succeeded
+    analytics_recorder.record(inputs, result)
+    try:
+        results_log.append(result["analysis_id"], inputs, result)
+    except OSError:
+        pass
+
+
+def _simulation_mode(result: dict) -> str:
+    simulation = result.get("quantum_simulation") or {}
+    if "simulation_method" in simulation:
+        return simulation["simulation_method"]
+    return "unavailable" if simulation.get("status") == "Qiskit not installed" else "mock"
+
+
+@app.get("/analytics")
+def analytics():
+    """Portfolio distributions across every analysis produced."""
+    return analytics_recorder.summary()
+
+
+@app.get("/rules")
+def rules():
+    """Active scoring rules version (the file is re-read when it changes)."""
+    active = get_rules()
+    return {
+        "version": active.version,
+        "file_version": active.label,
+        "path": rules_registry.path,
+        "last_error": rules_registry.last_error
+    }
+
+
+@app.get("/export")
+def export(format: str = "csv"):
+    """Streams every recorded analysis as CSV, Arrow IPC or Parquet."""
+    try:
+        chunks = iter_export(format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    extension = {"csv": "csv", "arrow": "arrows", "parquet": "parquet"}[format]
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename=analyses.{extension}"}
+    )
+
+
+@app.on_event("startup")
+def start_background_writers():
+    analytics_recorder.start()
+    if settings.REQUEST_LOG_ENABLED:
+        request_logger.start()
+
+
+@app.on_event("shutdown")
+def stop_background_writers():
+    analytics_recorder.stop()
+    request_logger.stop()
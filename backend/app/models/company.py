@@ -71,6 +71,7 @@ class AnalysisReport(BaseModel):
     implementation_roadmap: List[str]
     estimated_timeline: str
     budget_estimate: float
+    rules_version: Optional[str] = None  # scoring rules the report was computed with
     
     class Config:
         json_schema_extra = {
@@ -91,6 +92,7 @@ class AnalysisReport(BaseModel):
                 "risk_factors": ["High implementation costs"],
                 "implementation_roadmap": ["Phase 1: Assessment", "Phase 2: Pilot"],
                 "estimated_timeline": "24 months",
-                "budget_estimate": 1500000
+                "budget_estimate": 1500000,
+                "rules_version": "2026.10.1+c4a3a9d37198"
             }
         }
@@ -0,0 +1,129 @@
+"""
+Analysis Store
+Keeps recent analyses keyed by a hash of their normalized input
+so they can be referenced for incremental re-analysis and served
+as cache hits. An optional SharedCache makes entries visible to
+every worker on the host.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Any, Optional, Tuple
+import hashlib
+import json
+import os
+
+from app.config import settings
+from app.services.shared_cache import SharedCache
+
+
+# Bump when the result layout changes in a way the module hashes below
+# would not catch (e.g. a change outside these files).
+RESULT_SCHEMA_VERSION = 1
+
+# Modules whose code determines a result; any edit to them starts a
+# fresh shared-cache generation so a deploy never serves stale results.
+_RESULT_MODULES = ("scoring.py", "quantum_engine.py", "resource_estimator.py", "rules.py")
+
+
+def input_hash(inputs: Dict[str, Any]) -> str:
+    """Stable identifier for a normalized input."""
+
+    canonical = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+
+def code_generation() -> str:
+    """Fingerprint of the app version, result schema and result-producing code."""
+
+    digest = hashlib.sha256(f"{settings.APP_VERSION}:{RESULT_SCHEMA_VERSION}".encode())
+    directory = os.path.dirname(__file__)
+    for name in _RESULT_MODULES:
+        with open(os.path.join(directory, name), "rb") as handle:
+            digest.update(handle.read())
+    return digest.hexdigest()[:16]
+
+
+class AnalysisStore:
+    """
+    Bounded in-process LRU of analysis_id -> (inputs, result), backed
+    by an optional cross-worker SharedCache. Shared keys are scoped to
+    a code generation, so entries written by other code are never read.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        shared: Optional[SharedCache] = None,
+        generation: str = ""
+    ):
+        self.max_entries = max_entries
+        self.shared = shared
+        self.generation = generation
+        self._entries: "OrderedDict[str, Tuple[dict, dict]]" = OrderedDict()
+        self._lock = Lock()
+
+    def save(self, inputs: Dict[str, Any], result: Dict[str, Any]) -> str:
+        """Stores result with its analysis_id set; returns the id."""
+
+        analysis_id = input_hash(inputs)
+        result["analysis_id"] = analysis_id
+        self._remember(analysis_id, (inputs, result))
+
+        if self.shared is not None:
+            try:
+                self.shared.put(
+                    self._shared_key(analysis_id),
+                    {"inputs": inputs, "result": result}
+                )
+            except OSError:
+                pass  # Shared cache is best-effort; the local entry still serves
+
+        return analysis_id
+
+    def get(self, analysis_id: str) -> Optional[Tuple[dict, dict]]:
+
+        if not isinstance(analysis_id, str):
+            return None
+
+        with self._lock:
+            entry = self._entries.get(analysis_id)
+            if entry is not None:
+                self._entries.move_to_end(analysis_id)
+                return entry
+
+        if self.shared is None:
+            return None
+
+        try:
+            shared_entry = self.shared.get(self._shared_key(analysis_id))
+        except (OSError, ValueError):
+            return None
+
+        if shared_entry is None:
+            return None
+
+        entry = (shared_entry["inputs"], shared_entry["result"])
+        self._remember(analysis_id, entry)
+        return entry
+
+    def _shared_key(self, analysis_id: str) -> str:
+        return hashlib.sha256(f"{self.generation}:{analysis_id}".encode()).hexdigest()[:32]
+
+    def _remember(self, analysis_id: str, entry: Tuple[dict, dict]):
+
+        with self._lock:
+            self._entries[analysis_id] = entry
+            self._entries.move_to_end(analysis_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+analysis_store = AnalysisStore(
+    shared=SharedCache(
+        settings.SHARED_CACHE_PATH,
+        slots=settings.SHARED_CACHE_SLOTS,
+        slot_size=settings.SHARED_CACHE_SLOT_SIZE
+    ) if settings.SHARED_CACHE_ENABLED else None,
+    generation=code_generation()
+)
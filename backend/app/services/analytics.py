@@ -0,0 +1,456 @@
+"""
+Portfolio Analytics
+Incremental aggregates over every analysis produced: counts, means,
+mergeable quantile sketches and histograms of suitability_score,
+risk_level and qubit_estimate, overall and per problem_type / scale.
+
+Every structure is mergeable, so each worker keeps its own aggregates
+and periodically folds its pending delta into a shared snapshot file.
+"""
+
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, Optional
+import json
+import math
+import os
+
+from app.config import settings
+from app.services.rules import get_rules
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+
+SKETCH_RELATIVE_ACCURACY = 0.01
+SNAPSHOT_VERSION = 1
+REPORTED_QUANTILES = (0.5, 0.9, 0.99)
+
+
+# ============================================================
+# QUANTILE SKETCH
+# ============================================================
+
+class QuantileSketch:
+    """
+    Log-bucketed sketch (DDSketch style) for non-negative values.
+    Quantiles are within SKETCH_RELATIVE_ACCURACY of the true value,
+    memory is bounded by the value range, and two sketches merge
+    by adding bucket counts.
+    """
+
+    _gamma = (1 + SKETCH_RELATIVE_ACCURACY) / (1 - SKETCH_RELATIVE_ACCURACY)
+    _log_gamma = math.log(_gamma)
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float):
+        self.count += 1
+        if value <= 0:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: "QuantileSketch"):
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                return 2 * self._gamma ** index / (self._gamma + 1)
+
+        return 2 * self._gamma ** max(self.buckets) / (self._gamma + 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "buckets": {str(index): count for index, count in self.buckets.items()},
+            "zero_count": self.zero_count,
+            "count": self.count
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        sketch = cls()
+        sketch.buckets = {int(index): count for index, count in data["buckets"].items()}
+        sketch.zero_count = data["zero_count"]
+        sketch.count = data["count"]
+        return sketch
+
+
+# ============================================================
+# DISTRIBUTIONS
+# ============================================================
+
+def _score_bin(value: float) -> str:
+    low = min(int(value) // 10 * 10, 90)
+    return f"{low}-{low + 9 if low < 90 else 100}"
+
+
+def _decade_bin(value: float) -> str:
+    if value <= 0:
+        return "0"
+    return f"1e{int(math.floor(math.log10(value)))}"
+
+
+_BINNERS: Dict[str, Callable[[float], str]] = {
+    "score": _score_bin,
+    "decade": _decade_bin
+}
+
+
+class Distribution:
+    """Count, mean, min/max, quantile sketch and histogram of one metric."""
+
+    def __init__(self, binning: str):
+        self.binning = binning
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.sketch = QuantileSketch()
+        self.histogram: Dict[str, int] = {}
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.sketch.add(value)
+        label = _BINNERS[self.binning](value)
+        self.histogram[label] = self.histogram.get(label, 0) + 1
+
+    def merge(self, other: "Distribution"):
+        self.count += other.count
+        self.total += other.total
+        for bound, pick in (("min", min), ("max", max)):
+            values = [v for v in (getattr(self, bound), getattr(other, bound)) if v is not None]
+            setattr(self, bound, pick(values) if values else None)
+        self.sketch.merge(other.sketch)
+        for label, count in other.histogram.items():
+            self.histogram[label] = self.histogram.get(label, 0) + count
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "quantiles": {
+                f"p{int(q * 100)}": _round(self.sketch.quantile(q))
+                for q in REPORTED_QUANTILES
+            },
+            "histogram": dict(sorted(self.histogram.items(), key=_histogram_order))
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "binning": self.binning,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "sketch": self.sketch.to_dict(),
+            "histogram": self.histogram
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Distribution":
+        distribution = cls(data["binning"])
+        distribution.count = data["count"]
+        distribution.total = data["total"]
+        distribution.min = data["min"]
+        distribution.max = data["max"]
+        distribution.sketch = QuantileSketch.from_dict(data["sketch"])
+        distribution.histogram = dict(data["histogram"])
+        return distribution
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 3)
+
+
+def _histogram_order(item):
+    label = item[0]
+    if label.startswith("1e"):
+        return float(label)
+    return float(label.split("-")[0])
+
+
+class Aggregate:
+    """All tracked metrics for one slice of the portfolio."""
+
+    def __init__(self):
+        self.suitability_score = Distribution("score")
+        self.logical_qubits = Distribution("decade")
+        self.physical_qubits = Distribution("decade")
+        self.risk_level: Dict[str, int] = {}
+
+    def _distributions(self):
+        return ("suitability_score", "logical_qubits", "physical_qubits")
+
+    def add(self, result: Dict[str, Any]):
+        qubits = result["qubit_estimate"]
+        self.suitability_score.add(result["suitability_score"])
+        self.logical_qubits.add(qubits["logical_qubits"])
+        # None marks an infeasible estimate; it has no qubit count to add
+        if qubits["physical_qubits"] is not None:
+            self.physical_qubits.add(qubits["physical_qubits"])
+        risk = result["risk_level"]
+        self.risk_level[risk] = self.risk_level.get(risk, 0) + 1
+
+    def merge(self, other: "Aggregate"):
+        for name in self._distributions():
+            getattr(self, name).merge(getattr(other, name))
+        for risk, count in other.risk_level.items():
+            self.risk_level[risk] = self.risk_level.get(risk, 0) + count
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.suitability_score.count,
+            "suitability_score": self.suitability_score.summary(),
+            "risk_level": dict(self.risk_level),
+            "qubit_estimate": {
+                "logical_qubits": self.logical_qubits.summary(),
+                "physical_qubits": self.physical_qubits.summary()
+            }
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {name: getattr(self, name).to_dict() for name in self._distributions()}
+        data["risk_level"] = self.risk_level
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Aggregate":
+        aggregate = cls()
+        for name in aggregate._distributions():
+            setattr(aggregate, name, Distribution.from_dict(data[name]))
+        aggregate.risk_level = dict(data["risk_level"])
+        return aggregate
+
+
+# ============================================================
+# PORTFOLIO
+# ============================================================
+
+_DIMENSIONS = ("problem_type", "scale")
+
+# Values outside the rules tables share one slice, so the number of
+# slices stays bounded however varied the inputs are.
+OTHER_SLICE = "other"
+
+
+def _slice_key(dimension: str, inputs: Dict[str, Any]) -> str:
+    rules = get_rules(inputs.get("rules_version"))
+    table = rules.technical if dimension == "problem_type" else rules.scale
+    value = inputs[dimension]
+    return value if value in table.index else OTHER_SLICE
+
+
+class PortfolioAnalytics:
+    """Overall aggregate plus one aggregate per problem_type and scale value."""
+
+    def __init__(self):
+        self.overall = Aggregate()
+        self.by_dimension: Dict[str, Dict[str, Aggregate]] = {
+            dimension: {} for dimension in _DIMENSIONS
+        }
+
+    def add(self, inputs: Dict[str, Any], result: Dict[str, Any]):
+        self.overall.add(result)
+        for dimension in _DIMENSIONS:
+            slices = self.by_dimension[dimension]
+            key = _slice_key(dimension, inputs)
+            if key not in slices:
+                slices[key] = Aggregate()
+            slices[key].add(result)
+
+    def merge(self, other: "PortfolioAnalytics"):
+        self.overall.merge(other.overall)
+        for dimension in _DIMENSIONS:
+            slices = self.by_dimension[dimension]
+            for key, aggregate in other.by_dimension[dimension].items():
+                if key not in slices:
+                    slices[key] = Aggregate()
+                slices[key].merge(aggregate)
+
+    def summary(self) -> Dict[str, Any]:
+        data = {"overall": self.overall.summary()}
+        for dimension in _DIMENSIONS:
+            data[f"by_{dimension}"] = {
+                key: aggregate.summary()
+                for key, aggregate in sorted(self.by_dimension[dimension].items())
+            }
+        return data
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": SNAPSHOT_VERSION,
+            "overall": self.overall.to_dict(),
+            "by_dimension": {
+                dimension: {key: aggregate.to_dict() for key, aggregate in slices.items()}
+                for dimension, slices in self.by_dimension.items()
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PortfolioAnalytics":
+        portfolio = cls()
+        if data.get("version") != SNAPSHOT_VERSION:
+            return portfolio
+        portfolio.overall = Aggregate.from_dict(data["overall"])
+        for dimension in _DIMENSIONS:
+            portfolio.by_dimension[dimension] = {
+                key: Aggregate.from_dict(aggregate)
+                for key, aggregate in data["by_dimension"].get(dimension, {}).items()
+            }
+        return portfolio
+
+
+# ============================================================
+# RECORDER & SNAPSHOTS
+# ============================================================
+
+class AnalyticsRecorder:
+    """
+    Records results into a running view and a pending delta. A
+    background thread merges the delta into the snapshot file under a
+    file lock every snapshot_every records (or snapshot_interval
+    seconds), and refreshes the view from it, picking up other workers'
+    records as well. Recording itself never touches the file.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Optional[str],
+        snapshot_every: int = 100,
+        snapshot_interval: float = 60.0
+    ):
+        self.snapshot_path = snapshot_path
+        self.snapshot_every = snapshot_every
+        self.snapshot_interval = snapshot_interval
+        self._lock = Lock()
+        self._snapshot_lock = Lock()
+        self._pending = PortfolioAnalytics()
+        self._pending_count = 0
+        self._wake = Event()
+        self._stopping = False
+        self._thread: Optional[Thread] = None
+        self.last_error: Optional[str] = None
+        self._view = self._load() if snapshot_path else PortfolioAnalytics()
+
+    def record(self, inputs: Dict[str, Any], result: Dict[str, Any]):
+        with self._lock:
+            self._view.add(inputs, result)
+            self._pending.add(inputs, result)
+            self._pending_count += 1
+            due = self._pending_count >= self.snapshot_every
+
+        if due:
+            self._wake.set()
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return self._view.summary()
+
+    def start(self):
+        """Starts the snapshot thread (call once per worker process)."""
+
+        if self._thread is None:
+            self._stopping = False
+            self._thread = Thread(target=self._run, name="analytics-snapshot", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stops the snapshot thread and writes a final snapshot."""
+
+        if self._thread is not None:
+            self._stopping = True
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        self.snapshot()
+
+    def _run(self):
+        while not self._stopping:
+            self._wake.wait(self.snapshot_interval)
+            self._wake.clear()
+            if not self._stopping:
+                self.snapshot()
+
+    def snapshot(self):
+        """Merges the pending delta into the snapshot file (best-effort)."""
+
+        with self._snapshot_lock:
+            with self._lock:
+                delta, count = self._pending, self._pending_count
+                self._pending = PortfolioAnalytics()
+                self._pending_count = 0
+
+            if not self.snapshot_path or count == 0:
+                return
+
+            try:
+                merged = self._write_snapshot(delta)
+            except OSError as e:
+                # Keep the delta for the next attempt
+                self.last_error = str(e)
+                with self._lock:
+                    delta.merge(self._pending)
+                    self._pending = delta
+                    self._pending_count += count
+                return
+
+            self.last_error = None
+            with self._lock:
+                # Records that arrived during the write are still pending
+                merged.merge(self._pending)
+                self._view = merged
+
+    def _write_snapshot(self, delta: PortfolioAnalytics) -> PortfolioAnalytics:
+
+        os.makedirs(os.path.dirname(self.snapshot_path) or ".", exist_ok=True)
+        with open(self.snapshot_path + ".lock", "a") as lock_file:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+
+            merged = self._load()
+            merged.merge(delta)
+
+            temp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w") as handle:
+                json.dump(merged.to_dict(), handle, separators=(",", ":"))
+            os.replace(temp_path, self.snapshot_path)
+
+        return merged
+
+    def _load(self) -> PortfolioAnalytics:
+        try:
+            with open(self.snapshot_path) as handle:
+                return PortfolioAnalytics.from_dict(json.load(handle))
+        except (OSError, ValueError, KeyError):
+            return PortfolioAnalytics()
+
+
+analytics_recorder = AnalyticsRecorder(
+    settings.ANALYTICS_SNAPSHOT_PATH,
+    snapshot_every=settings.ANALYTICS_SNAPSHOT_EVERY
+)
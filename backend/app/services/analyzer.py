@@ -8,6 +8,7 @@ from ..models import (
     ReadinessScore,
     QuantumReadiness
 )
+from .rules import CompiledRules, get_rules
 
 class QuantumAnalyzer:
     """Service for analyzing quantum readiness"""
@@ -34,7 +35,8 @@ class QuantumAnalyzer:
         """
         
         # Calculate readiness scores for each category
-        readiness_scores = self._calculate_readiness_scores(company_data)
+        rules = get_rules()
+        readiness_scores = self._calculate_readiness_scores(company_data, rules)
         overall_score = sum(score.score for score in readiness_scores) / len(readiness_scores)
         
         # Determine readiness level
@@ -60,35 +62,42 @@ class QuantumAnalyzer:
             risk_factors=risk_factors,
             implementation_roadmap=roadmap,
             estimated_timeline=self._estimate_timeline(company_data),
-            budget_estimate=budget_estimate
+            budget_estimate=budget_estimate,
+            rules_version=rules.version
         )
         
         return report
     
-    def _calculate_readiness_scores(self, company_data: CompanyInput) -> List[ReadinessScore]:
-        """Calculate readiness scores for each category"""
+    def _calculate_readiness_scores(self, company_data: CompanyInput, rules: CompiledRules) -> List[ReadinessScore]:
+        """Calculate readiness scores for each category from the scoring rules"""
         scores = []
+        params = rules.readiness
         
-        # Technical Infrastructure (40% from tech maturity)
-        tech_score = (company_data.current_tech_maturity / 10) * 40 + 60
+        # Technical Infrastructure (driven by tech maturity)
+        tech = params["technical_infrastructure"]
+        tech_score = company_data.current_tech_maturity * tech["per_maturity_point"] + tech["base"]
         scores.append(ReadinessScore(
             category="Technical Infrastructure",
-            score=min(tech_score, 100),
+            score=min(tech_score, tech["max"]),
             recommendation="Upgrade cloud infrastructure and security protocols"
         ))
         
         # Workforce Skills (based on IT team and employees)
-        workforce_score = 50 if company_data.has_it_team else 30
-        workforce_score += min(company_data.employees / 100, 30)
+        workforce = params["workforce_skills"]
+        workforce_score = workforce["with_it_team"] if company_data.has_it_team else workforce["without_it_team"]
+        workforce_score += min(company_data.employees * workforce["per_employee"], workforce["employee_cap"])
         scores.append(ReadinessScore(
             category="Workforce Skills",
-            score=min(workforce_score, 100),
+            score=min(workforce_score, workforce["max"]),
             recommendation="Invest in quantum computing training programs"
         ))
         
         # Financial Readiness
-        financial_ratio = (company_data.budget_for_quantum / (company_data.annual_revenue * 0.05)) * 50
-        financial_score = min(financial_ratio + 40, 100)
+        financial = params["financial_readiness"]
+        financial_ratio = (
+            company_data.budget_for_quantum / (company_data.annual_revenue * financial["revenue_share"])
+        ) * financial["ratio_weight"]
+        financial_score = min(financial_ratio + financial["base"], financial["max"])
         scores.append(ReadinessScore(
             category="Financial Readiness",
             score=financial_score,
@@ -96,7 +105,8 @@ class QuantumAnalyzer:
         ))
         
         # Leadership Support
-        leadership_score = 60 if company_data.quantum_awareness else 40
+        leadership = params["leadership_support"]
+        leadership_score = leadership["aware"] if company_data.quantum_awareness else leadership["unaware"]
         scores.append(ReadinessScore(
             category="Leadership Support",
             score=leadership_score,
@@ -104,7 +114,8 @@ class QuantumAnalyzer:
         ))
         
         # Strategic Alignment
-        alignment_score = 70 if company_data.primary_use_case else 50
+        alignment = params["strategic_alignment"]
+        alignment_score = alignment["with_use_case"] if company_data.primary_use_case else alignment["without_use_case"]
         scores.append(ReadinessScore(
             category="Strategic Alignment",
             score=alignment_score,
@@ -1,28 +1,213 @@
 import random
 import math
+import time
+from functools import lru_cache
 
 try:
     from qiskit import QuantumCircuit
+    from qiskit.quantum_info import Statevector
     from qiskit_aer import AerSimulator
+    from qiskit_aer.noise import NoiseModel, ReadoutError, depolarizing_error
     QISKIT_AVAILABLE = True
 except ImportError:
     QISKIT_AVAILABLE = False
 
 
-def run_dynamic_quantum_simulation(scale: str, suitability_score: int):
+# ============================================================
+# DEVICE NOISE PROFILES
+# ============================================================
+
+# Representative gate / readout error rates per device family.
+NOISE_PROFILES = {
+    "superconducting": {
+        "single_qubit_error": 1e-3,
+        "two_qubit_error": 1e-2,
+        "readout_error": 2e-2
+    },
+    "trapped_ion": {
+        "single_qubit_error": 1e-4,
+        "two_qubit_error": 3e-3,
+        "readout_error": 5e-3
+    },
+    "neutral_atom": {
+        "single_qubit_error": 5e-4,
+        "two_qubit_error": 5e-3,
+        "readout_error": 1e-2
+    }
+}
+
+# "trajectory" maps to Aer's statevector method, which samples noise
+# as Monte Carlo trajectories instead of evolving the full density matrix.
+SIMULATION_METHODS = {
+    "density_matrix": "density_matrix",
+    "trajectory": "statevector"
+}
+
+DEFAULT_SHOTS = 1024
+SHOT_BATCH_SIZE = 256
+LATENCY_BUDGET_SECONDS = 2.0
+
+# Streaming runs have no latency budget: counts are pushed per batch,
+# so they can afford many more shots.
+STREAM_SHOTS = 8192
+MAX_STREAM_SHOTS = 65536
+STREAM_BATCHES = 16
+
+
+@lru_cache(maxsize=None)
+def _noise_model(noise_profile: str):
+    """Build the Aer noise model for a device profile (once per process)."""
+
+    profile = NOISE_PROFILES[noise_profile]
+
+    model = NoiseModel()
+    model.add_all_qubit_quantum_error(
+        depolarizing_error(profile["single_qubit_error"], 1), ["h", "ry"]
+    )
+    model.add_all_qubit_quantum_error(
+        depolarizing_error(profile["two_qubit_error"], 2), ["cx"]
+    )
+
+    p = profile["readout_error"]
+    model.add_all_qubit_readout_error(ReadoutError([[1 - p, p], [p, 1 - p]]))
+
+    return model
+
+
+@lru_cache(maxsize=None)
+def _simulator(noise_profile, method: str):
+    """Shared simulator instance per (noise profile, method) pair."""
+
+    if noise_profile is None:
+        return AerSimulator()
+
+    return AerSimulator(
+        method=SIMULATION_METHODS[method],
+        noise_model=_noise_model(noise_profile)
+    )
+
+
+def _build_circuit(n_qubits: int, suitability_score: int):
+
+    qc = QuantumCircuit(n_qubits)
+
+    # Superposition layer
+    for i in range(n_qubits):
+        qc.h(i)
+
+    # Dynamic rotation
+    base_angle = (suitability_score / 100) * math.pi
+
+    for i in range(n_qubits):
+        jitter = random.uniform(-0.2, 0.2)
+        qc.ry(base_angle + jitter, i)
+
+    # Entanglement
+    for i in range(n_qubits - 1):
+        qc.cx(i, i + 1)
+
+    return qc
+
+
+def _iter_shot_batches(simulator, qc, shots: int, batch_size: int, budget):
+    """
+    Yields (batch_counts, shots_executed, done) until all shots have run
+    or the latency budget (seconds, None for unbounded) is spent.
+    """
+
+    deadline = None if budget is None else time.perf_counter() + budget
+    executed = 0
+
+    while executed < shots:
+        batch = min(batch_size, shots - executed)
+        counts = simulator.run(qc, shots=batch).result().get_counts()
+        executed += batch
+        done = executed >= shots or (
+            deadline is not None and time.perf_counter() >= deadline
+        )
+        yield counts, executed, done
+
+        if done:
+            break
+
+
+def _classical_fidelity(ideal: dict, counts: dict, shots: int) -> float:
+    """Bhattacharyya fidelity between the ideal and sampled distributions."""
+
+    overlap = sum(
+        math.sqrt(p * counts.get(state, 0) / shots)
+        for state, p in ideal.items()
+    )
+    return round(overlap ** 2, 4)
+
+
+def validate_noise_options(noise_profile, method: str):
+
+    if noise_profile is not None and noise_profile not in NOISE_PROFILES:
+        raise ValueError(f"Unknown noise profile: {noise_profile}")
+
+    if method not in SIMULATION_METHODS:
+        raise ValueError(f"Unknown simulation method: {method}")
+
+
+def run_dynamic_quantum_simulation(
+    scale: str,
+    suitability_score: int,
+    noise_profile=None,
+    method: str = "density_matrix",
+    shots: int = DEFAULT_SHOTS
+):
     """
     Runs dynamically parameterized quantum circuit
     and returns structured output compatible with frontend.
+
+    With a noise_profile, the circuit runs under the cached device
+    noise model in shot batches bounded by LATENCY_BUDGET_SECONDS,
+    and the result reports fidelity against the ideal distribution.
+    """
+
+    batch_size = shots if noise_profile is None else SHOT_BATCH_SIZE
+
+    for result in iter_dynamic_quantum_simulation(
+        scale,
+        suitability_score,
+        noise_profile=noise_profile,
+        method=method,
+        shots=shots,
+        batch_size=batch_size,
+        budget=LATENCY_BUDGET_SECONDS
+    ):
+        pass
+
+    return result
+
+
+def iter_dynamic_quantum_simulation(
+    scale: str,
+    suitability_score: int,
+    noise_profile=None,
+    method: str = "density_matrix",
+    shots: int = DEFAULT_SHOTS,
+    batch_size: int = SHOT_BATCH_SIZE,
+    budget=None
+):
+    """
+    Same simulation as run_dynamic_quantum_simulation, executed in
+    batches of batch_size shots. Yields the cumulative result after
+    every batch with status "running"; the last one has status "success".
     """
 
+    validate_noise_options(noise_profile, method)
+
     if not QISKIT_AVAILABLE:
-        return {
+        yield {
             "status": "Qiskit not installed",
             "qubits_used": 0,
             "measured_state": None,
             "probability": None,
             "measurement_distribution": {}
         }
+        return
 
     scale_map = {
         "small": 2,
@@ -33,38 +218,31 @@ def run_dynamic_quantum_simulation(scale: str, suitability_score: int):
 
     n_qubits = scale_map.get(scale, 2)
 
-    qc = QuantumCircuit(n_qubits)
+    qc = _build_circuit(n_qubits, suitability_score)
+    ideal = Statevector(qc).probabilities_dict()
+    qc.measure_all()
 
-    # Superposition layer
-    for i in range(n_qubits):
-        qc.h(i)
+    simulator = _simulator(noise_profile, method)
 
-    # Dynamic rotation
-    base_angle = (suitability_score / 100) * math.pi
+    counts = {}
+    for batch_counts, executed, done in _iter_shot_batches(
+        simulator, qc, shots, batch_size, budget
+    ):
+        for state, count in batch_counts.items():
+            counts[state] = counts.get(state, 0) + count
 
-    for i in range(n_qubits):
-        jitter = random.uniform(-0.2, 0.2)
-        qc.ry(base_angle + jitter, i)
-
-    # Entanglement
-    for i in range(n_qubits - 1):
-        qc.cx(i, i + 1)
+        # 🔥 Extract most probable state
+        measured_state = max(counts, key=counts.get)
+        probability = round(counts[measured_state] / executed, 3)
 
-    qc.measure_all()
-
-    simulator = AerSimulator()
-    job = simulator.run(qc, shots=1024)
-    result = job.result()
-    counts = result.get_counts()
-
-    # 🔥 Extract most probable state
-    measured_state = max(counts, key=counts.get)
-    probability = round(counts[measured_state] / 1024, 3)
-
-    return {
-        "status": "success",
-        "qubits_used": n_qubits,
-        "measured_state": measured_state,
-        "probability": probability,
-        "measurement_distribution": counts
-    }
+        yield {
+            "status": "success" if done else "running",
+            "qubits_used": n_qubits,
+            "measured_state": measured_state,
+            "probability": probability,
+            "measurement_distribution": dict(counts),
+            "noise_profile": noise_profile,
+            "simulation_method": method if noise_profile else "ideal",
+            "shots": executed,
+            "fidelity": _classical_fidelity(ideal, counts, executed)
+        }
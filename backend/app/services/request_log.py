@@ -0,0 +1,264 @@
+"""
+Structured Request Log
+Sampled JSON request/analysis records, queued in memory and written to
+rotating local files by a background listener thread. Request handlers
+only ever do a non-blocking put; when the queue is full the record is
+dropped and counted.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, Optional
+import json
+import logging
+import os
+import queue
+import random
+import time
+
+from app.config import settings
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # No slot locking (e.g. Windows): every process writes slot 0
+    FCNTL_AVAILABLE = False
+
+
+_current_record: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "request_log_record", default=None
+)
+
+
+# ============================================================
+# ANNOTATION API (used by request handlers)
+# ============================================================
+
+def annotate(**fields):
+    """Adds fields to the current request's record, if it is sampled."""
+
+    record = _current_record.get()
+    if record is not None:
+        record.update(fields)
+
+
+@contextmanager
+def stage(name: str):
+    """Times a block into the current record's stages_ms."""
+
+    record = _current_record.get()
+    if record is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record["stages_ms"][name] = round((time.perf_counter() - start) * 1000, 3)
+
+
+def current_timings() -> Optional[Dict[str, float]]:
+    """A dict to collect per-section timings into, or None if not sampled."""
+
+    record = _current_record.get()
+    if record is None:
+        return None
+    return record.setdefault("sections_ms", {})
+
+
+# ============================================================
+# QUEUE & WRITER
+# ============================================================
+
+class _DroppingQueueHandler(QueueHandler):
+    """Never blocks: a full queue drops the record and counts it."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Serialization happens on the listener thread, not here
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _DroppingQueueListener(QueueListener):
+    """Makes room for the stop sentinel rather than failing on a full queue."""
+
+    def __init__(self, handler: _DroppingQueueHandler, *handlers):
+        super().__init__(handler.queue, *handlers)
+        self._producer = handler
+
+    def enqueue_sentinel(self):
+        while True:
+            try:
+                self.queue.put_nowait(self._sentinel)
+                return
+            except queue.Full:
+                pass
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self._producer.dropped += 1
+            except queue.Empty:
+                pass
+
+
+class _JsonFormatter(logging.Formatter):
+
+    def format(self, record):
+        return json.dumps(record.msg, separators=(",", ":"), default=str)
+
+
+class RequestLogger:
+    """Sampling front end over a bounded queue and a rotating file writer."""
+
+    def __init__(
+        self,
+        directory: str,
+        sample_rate: float = 1.0,
+        queue_size: int = 10000,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5
+    ):
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._handler = _DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+        self._listener: Optional[_DroppingQueueListener] = None
+        self._slot_lock = None
+
+    @property
+    def dropped(self) -> int:
+        return self._handler.dropped
+
+    def should_sample(self) -> bool:
+        return self._listener is not None and random.random() < self.sample_rate
+
+    def submit(self, record: Dict[str, Any]):
+        self._handler.handle(
+            logging.LogRecord("requests", logging.INFO, "", 0, record, None, None)
+        )
+
+    def start(self):
+        """Starts the writer thread (call once per worker process)."""
+
+        if self._listener is not None:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        slot = self._claim_slot()
+        file_handler = RotatingFileHandler(
+            os.path.join(self.directory, f"requests.{slot}.jsonl"),
+            maxBytes=self.max_bytes,
+            backupCount=self.backup_count
+        )
+        file_handler.setFormatter(_JsonFormatter())
+
+        self._listener = _DroppingQueueListener(self._handler, file_handler)
+        self._listener.start()
+
+    def stop(self):
+        """Flushes queued records and stops the writer thread."""
+
+        if self._listener is not None:
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+
+        if self._slot_lock is not None:
+            self._slot_lock.close()
+            self._slot_lock = None
+
+    def _claim_slot(self) -> int:
+        """
+        Lowest file slot no live process holds. Rotating handlers cannot
+        share a file, and reusing slots keeps the number of file sets (and
+        so disk use) bounded by the number of concurrent workers rather
+        than growing with every restart.
+        """
+
+        if not FCNTL_AVAILABLE:
+            return 0
+
+        slot = 0
+        while True:
+            lock_file = open(os.path.join(self.directory, f"requests.{slot}.lock"), "a")
+            try:
+                # Released by the kernel when the holding process exits
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                slot += 1
+                continue
+            self._slot_lock = lock_file
+            return slot
+
+
+# ============================================================
+# ASGI MIDDLEWARE
+# ============================================================
+
+class RequestLogMiddleware:
+    """
+    Opens a record for each sampled HTTP request, lets handlers annotate
+    it, and submits it with status, duration and response size once the
+    response has been sent.
+    """
+
+    def __init__(self, app, logger: "RequestLogger"):
+        self.app = app
+        self.logger = logger
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http" or not self.logger.should_sample():
+            await self.app(scope, receive, send)
+            return
+
+        record: Dict[str, Any] = {
+            "timestamp": round(time.time(), 3),
+            "method": scope["method"],
+            "path": scope["path"],
+            "stages_ms": {},
+            "dropped_so_far": self.logger.dropped
+        }
+        response_bytes = 0
+
+        async def send_and_measure(message):
+            nonlocal response_bytes
+            if message["type"] == "http.response.start":
+                record["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        token = _current_record.set(record)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_and_measure)
+        finally:
+            _current_record.reset(token)
+            record["duration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+            record["response_bytes"] = response_bytes
+            self.logger.submit(record)
+
+
+request_logger = RequestLogger(
+    settings.REQUEST_LOG_DIR,
+    sample_rate=settings.REQUEST_LOG_SAMPLE_RATE,
+    queue_size=settings.REQUEST_LOG_QUEUE_SIZE,
+    max_bytes=settings.REQUEST_LOG_MAX_BYTES,
+    backup_count=settings.REQUEST_LOG_BACKUPS
+)
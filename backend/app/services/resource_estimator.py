@@ -0,0 +1,230 @@
+"""
+Fault-Tolerant Resource Estimator
+Surface-code estimates of code distance, physical qubits,
+T-count / T-depth and wall-clock runtime per algorithm.
+"""
+
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List
+import math
+
+
+# ============================================================
+# MODEL CONSTANTS
+# ============================================================
+
+DEFAULT_PHYSICAL_ERROR_RATE = 1e-3
+
+# Surface code: p_L(d) = PREFACTOR * (p / THRESHOLD) ** ((d + 1) / 2)
+SURFACE_CODE_THRESHOLD = 1e-2
+SURFACE_CODE_PREFACTOR = 0.1
+MAX_CODE_DISTANCE = 101
+
+# Total acceptable logical failure probability for one circuit run
+ERROR_BUDGET = 1e-2
+
+CODE_CYCLE_SECONDS = 1e-6
+
+# Physical qubits per logical patch and per 15-to-1 distillation factory,
+# both in units of d^2.
+PATCH_QUBITS_PER_D2 = 2
+FACTORY_QUBITS_PER_D2 = 22
+# Logical time steps a factory needs to emit one T state
+FACTORY_STEPS_PER_T = 5.5
+
+# T gates to synthesize one arbitrary rotation to ~1e-10 precision
+ROTATION_T_COUNT = math.ceil(3 * math.log2(1e10))
+TOFFOLI_T_COUNT = 7
+TOFFOLI_T_DEPTH = 3
+
+QAOA_LAYERS = 10
+QAOA_EDGES_PER_NODE = 1.5
+QAOA_EDGE_COLORS = 4
+VQE_LAYERS = 4
+VQE_REPETITIONS = 1_000_000
+VQC_LAYERS = 2
+VQC_REPETITIONS = 100_000
+
+PROBLEM_SIZE = {
+    "small": 100,
+    "medium": 1000,
+    "large": 10000,
+    "massive": 100000
+}
+
+
+# ============================================================
+# LOGICAL REQUIREMENTS PER ALGORITHM
+# ============================================================
+
+@lru_cache(maxsize=None)
+def _logical_requirements(problem_type: str, scale: str):
+    """
+    Returns (algorithm, logical_qubits, t_count, t_depth, repetitions)
+    for a single circuit execution.
+    """
+
+    size = PROBLEM_SIZE.get(scale, 1000)
+
+    if problem_type == "optimization":
+        n = size
+        rotations_per_layer = QAOA_EDGES_PER_NODE * n + n
+        t_count = QAOA_LAYERS * rotations_per_layer * ROTATION_T_COUNT
+        t_depth = QAOA_LAYERS * (QAOA_EDGE_COLORS + 1) * ROTATION_T_COUNT
+        return "QAOA", n, int(t_count), t_depth, 1
+
+    if problem_type == "search":
+        n = math.ceil(math.log2(size))
+        iterations = math.floor(math.pi / 4 * math.sqrt(size))
+        # Oracle + diffusion, each an n-controlled Z built from 2(n-1) Toffolis
+        toffolis = iterations * 2 * 2 * (n - 1)
+        return (
+            "Grover", n,
+            toffolis * TOFFOLI_T_COUNT,
+            toffolis * TOFFOLI_T_DEPTH,
+            1
+        )
+
+    if problem_type == "cryptography":
+        n = size // 2
+        bits = max(n // 2, 1)
+        toffolis = math.ceil(0.3 * bits ** 3)
+        return (
+            "Shor", n,
+            toffolis * TOFFOLI_T_COUNT,
+            math.ceil(toffolis / bits) * TOFFOLI_T_DEPTH,
+            1
+        )
+
+    if problem_type == "molecular_simulation":
+        n = int(size * 0.05)
+        return (
+            "VQE", n,
+            VQE_LAYERS * 2 * n * ROTATION_T_COUNT,
+            VQE_LAYERS * 2 * ROTATION_T_COUNT,
+            VQE_REPETITIONS
+        )
+
+    if problem_type == "machine_learning":
+        n = int(size * 0.01)
+        return (
+            "Variational Quantum Circuit", n,
+            VQC_LAYERS * 2 * n * ROTATION_T_COUNT,
+            VQC_LAYERS * 2 * ROTATION_T_COUNT,
+            VQC_REPETITIONS
+        )
+
+    return "Not Applicable", 0, 0, 0, 0
+
+
+# ============================================================
+# CODE DISTANCE TABLES
+# ============================================================
+
+_DISTANCES = tuple(range(3, MAX_CODE_DISTANCE + 1, 2))
+
+
+@lru_cache(maxsize=1024)
+def _distance_table(physical_error_rate: float):
+    """
+    Maximum logical spacetime volume (logical qubits x logical steps)
+    each odd distance can protect within ERROR_BUDGET, ascending.
+    """
+
+    ratio = physical_error_rate / SURFACE_CODE_THRESHOLD
+
+    return tuple(
+        ERROR_BUDGET / (SURFACE_CODE_PREFACTOR * ratio ** ((d + 1) / 2) * d)
+        for d in _DISTANCES
+    )
+
+
+def code_distance(physical_error_rate: float, logical_volume: float):
+    """Smallest odd code distance protecting logical_volume, or None."""
+
+    if physical_error_rate >= SURFACE_CODE_THRESHOLD:
+        return None
+
+    table = _distance_table(physical_error_rate)
+    index = bisect_left(table, logical_volume)
+
+    if index == len(table):
+        return None
+
+    return _DISTANCES[index]
+
+
+# ============================================================
+# ESTIMATION
+# ============================================================
+
+def estimate_resources(
+    problem_type: str,
+    scale: str,
+    physical_error_rate: float = DEFAULT_PHYSICAL_ERROR_RATE
+) -> Dict[str, Any]:
+
+    algorithm, logical, t_count, t_depth, repetitions = _logical_requirements(
+        problem_type, scale
+    )
+
+    estimate = {
+        "algorithm_used": algorithm,
+        "logical_qubits": logical,
+        "physical_qubits": None,
+        "code_distance": None,
+        "t_count": t_count,
+        "t_depth": t_depth,
+        "runtime_seconds": None,
+        "physical_error_rate": physical_error_rate
+    }
+
+    if logical == 0:
+        estimate["physical_qubits"] = 0
+        return estimate
+
+    # Every logical step costs d code cycles; at least one step per circuit.
+    steps = max(t_depth, 1)
+    distance = code_distance(physical_error_rate, logical * steps)
+
+    # No reachable distance: physical_qubits stays None, not a misleading 0
+    if distance is None:
+        return estimate
+
+    factories = math.ceil(t_count / steps * FACTORY_STEPS_PER_T) if t_count else 0
+    d2 = distance ** 2
+
+    estimate["code_distance"] = distance
+    estimate["physical_qubits"] = (
+        logical * PATCH_QUBITS_PER_D2 * d2 +
+        factories * FACTORY_QUBITS_PER_D2 * d2
+    )
+    estimate["runtime_seconds"] = round(
+        steps * distance * CODE_CYCLE_SECONDS * repetitions, 6
+    )
+
+    return estimate
+
+
+def estimate_resources_grid(
+    problem_types: Iterable[str],
+    scales: Iterable[str],
+    error_rates: Iterable[float]
+) -> List[Dict[str, Any]]:
+    """
+    Estimates over the full problem type x scale x error rate grid.
+
+    Logical requirements are computed once per (problem type, scale) and
+    distance tables once per error rate, so each grid cell is a lookup.
+    """
+
+    error_rates = list(error_rates)
+    scales = list(scales)
+
+    return [
+        estimate_resources(problem_type, scale, rate)
+        for problem_type in problem_types
+        for scale in scales
+        for rate in error_rates
+    ]
@@ -0,0 +1,318 @@
+"""
+Results Log & Columnar Export
+Every analysis is appended to a local log as one flat row in a fixed
+column order. Exports stream the log back in bounded record batches
+as CSV, Arrow IPC or Parquet without materializing per-row dicts.
+"""
+
+from functools import lru_cache
+from itertools import islice
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import csv
+import io
+import json
+import os
+import time
+
+from app.config import settings
+
+# Optional import (CSV export works without pyarrow)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+EXPORT_FORMATS = ("csv", "arrow", "parquet")
+DEFAULT_BATCH_SIZE = 65536
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet"
+}
+
+
+# ============================================================
+# COLUMN SCHEMA
+# ============================================================
+
+# (column, arrow type, source, path) - source is "meta", "inputs" or "result"
+EXPORT_SCHEMA: Tuple[Tuple[str, str, str, Tuple[str, ...]], ...] = (
+    ("analysis_id", "string", "meta", ("analysis_id",)),
+    ("recorded_at", "float64", "meta", ("recorded_at",)),
+    ("problem_type", "string", "inputs", ("problem_type",)),
+    ("scale", "string", "inputs", ("scale",)),
+    ("annual_compute_cost", "float64", "inputs", ("annual_compute_cost",)),
+    ("time_sensitivity", "string", "inputs", ("time_sensitivity",)),
+    ("has_quantum_team", "bool_", "inputs", ("has_quantum_team",)),
+    ("has_research_partnerships", "bool_", "inputs", ("has_research_partnerships",)),
+    ("has_advanced_hpc", "bool_", "inputs", ("has_advanced_hpc",)),
+    ("business_criticality", "string", "inputs", ("business_criticality",)),
+    ("investment_horizon", "string", "inputs", ("investment_horizon",)),
+    ("noise_profile", "string", "inputs", ("noise_profile",)),
+    ("physical_error_rate", "float64", "inputs", ("physical_error_rate",)),
+    ("rules_version", "string", "inputs", ("rules_version",)),
+    ("suitability_score", "int64", "result", ("suitability_score",)),
+    ("risk_level", "string", "result", ("risk_level",)),
+    ("breakdown_technical", "float64", "result", ("breakdown", "technical")),
+    ("breakdown_scale", "float64", "result", ("breakdown", "scale")),
+    ("breakdown_economic", "float64", "result", ("breakdown", "economic")),
+    ("breakdown_urgency", "float64", "result", ("breakdown", "urgency")),
+    ("breakdown_organizational", "float64", "result", ("breakdown", "organizational")),
+    ("qubit_algorithm_used", "string", "result", ("qubit_estimate", "algorithm_used")),
+    ("qubit_logical_qubits", "int64", "result", ("qubit_estimate", "logical_qubits")),
+    ("qubit_physical_qubits", "int64", "result", ("qubit_estimate", "physical_qubits")),
+    ("qubit_code_distance", "int64", "result", ("qubit_estimate", "code_distance")),
+    ("qubit_t_count", "int64", "result", ("qubit_estimate", "t_count")),
+    ("qubit_t_depth", "int64", "result", ("qubit_estimate", "t_depth")),
+    ("qubit_runtime_seconds", "float64", "result", ("qubit_estimate", "runtime_seconds")),
+    ("confidence_optimistic_roi_years", "int64", "result",
+        ("confidence_band", "optimistic_roi_years")),
+    ("confidence_conservative_roi_years", "int64", "result",
+        ("confidence_band", "conservative_roi_years")),
+    ("hardware_feasibility", "string", "result", ("hardware_feasibility",)),
+    ("simulation_status", "string", "result", ("quantum_simulation", "status")),
+    ("simulation_qubits_used", "int64", "result", ("quantum_simulation", "qubits_used")),
+    ("simulation_measured_state", "string", "result", ("quantum_simulation", "measured_state")),
+    ("simulation_probability", "float64", "result", ("quantum_simulation", "probability")),
+    ("simulation_method", "string", "result", ("quantum_simulation", "simulation_method")),
+    ("simulation_shots", "int64", "result", ("quantum_simulation", "shots")),
+    ("simulation_fidelity", "float64", "result", ("quantum_simulation", "fidelity"))
+)
+
+EXPORT_COLUMNS = tuple(column for column, _, _, _ in EXPORT_SCHEMA)
+
+# Column order of every results log version, so rows written by earlier
+# builds are read by column name. Never edit an entry: when EXPORT_SCHEMA
+# changes, add a version and bump LOG_SCHEMA_VERSION.
+LOG_SCHEMA_VERSION = 3
+_ADDED_IN_V2 = ("rules_version",)
+_ADDED_IN_V3 = ("simulation_method", "simulation_shots")
+LOG_COLUMNS: Dict[int, Tuple[str, ...]] = {
+    3: EXPORT_COLUMNS,
+    2: tuple(c for c in EXPORT_COLUMNS if c not in _ADDED_IN_V3),
+    1: tuple(c for c in EXPORT_COLUMNS if c not in _ADDED_IN_V3 + _ADDED_IN_V2)
+}
+
+# Rows from before versioning carry no version; their length identifies it
+_UNVERSIONED_BY_LENGTH = {len(columns): version for version, columns in LOG_COLUMNS.items()}
+
+
+def flatten_result(
+    analysis_id: str,
+    inputs: Dict[str, Any],
+    result: Dict[str, Any]
+) -> List[Any]:
+    """One row in EXPORT_COLUMNS order; missing values become None."""
+
+    sources = {
+        "meta": {"analysis_id": analysis_id, "recorded_at": round(time.time(), 3)},
+        "inputs": inputs,
+        "result": result
+    }
+    row = []
+
+    for _, _, source, path in EXPORT_SCHEMA:
+        value = sources[source]
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        row.append(value)
+
+    return row
+
+
+# ============================================================
+# RESULTS LOG
+# ============================================================
+
+class ResultsLog:
+    """
+    Append-only log of flattened rows, one JSON array per line, each
+    prefixed with the LOG_SCHEMA_VERSION it was written under. Reading
+    maps every row onto the current EXPORT_COLUMNS.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.skipped_rows = 0
+        self._lock = Lock()
+
+    def append(self, analysis_id: str, inputs: Dict[str, Any], result: Dict[str, Any]):
+
+        if not self.path:
+            return
+
+        line = json.dumps(
+            [LOG_SCHEMA_VERSION] + flatten_result(analysis_id, inputs, result),
+            separators=(",", ":")
+        ) + "\n"
+
+        # A single O_APPEND write per row keeps lines whole across workers
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                os.write(fd, line.encode())
+            finally:
+                os.close(fd)
+
+    def iter_batches(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[List[list]]:
+        """
+        Yields lists of at most batch_size rows in EXPORT_COLUMNS order.
+        Rows of an unknown version or shape are skipped and counted.
+        """
+
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        with open(self.path) as handle:
+            while True:
+                lines = list(islice(handle, batch_size))
+                if not lines:
+                    return
+                rows = []
+                for line in lines:
+                    if line.strip():
+                        row = _to_current(json.loads(line))
+                        if row is None:
+                            self.skipped_rows += 1
+                        else:
+                            rows.append(row)
+                yield rows
+
+
+def _to_current(line: list) -> Optional[list]:
+
+    version = line[0] if line else None
+    if type(version) is int:
+        values = line[1:]
+    else:
+        values = line
+        version = _UNVERSIONED_BY_LENGTH.get(len(line))
+
+    columns = LOG_COLUMNS.get(version)
+    if columns is None or len(values) != len(columns):
+        return None
+    if version == LOG_SCHEMA_VERSION:
+        return values
+
+    return [values[i] if i is not None else None for i in _column_map(version)]
+
+
+@lru_cache(maxsize=None)
+def _column_map(version: int) -> Tuple[Optional[int], ...]:
+    """Position of each current column in an older version's rows."""
+
+    positions = {column: i for i, column in enumerate(LOG_COLUMNS[version])}
+    return tuple(positions.get(column) for column in EXPORT_COLUMNS)
+
+
+results_log = ResultsLog(settings.RESULTS_LOG_PATH)
+
+
+# ============================================================
+# EXPORT WRITERS
+# ============================================================
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only sink whose buffered bytes are drained after each batch."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def arrow_schema():
+    return pa.schema([
+        (column, getattr(pa, arrow_type)())
+        for column, arrow_type, _, _ in EXPORT_SCHEMA
+    ])
+
+
+def _record_batch(rows: List[list], schema):
+    # Transpose rows to columns and build one typed array per column
+    columns = list(zip(*rows))
+    return pa.RecordBatch.from_arrays(
+        [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+        schema=schema
+    )
+
+
+def _iter_csv(batches: Iterator[List[list]]) -> Iterator[bytes]:
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+
+    for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _iter_arrow(batches: Iterator[List[list]], file_format: str) -> Iterator[bytes]:
+
+    schema = arrow_schema()
+    sink = _ChunkSink()
+    stream = pa.PythonFile(sink, mode="w")
+
+    if file_format == "parquet":
+        writer = pq.ParquetWriter(stream, schema)
+    else:
+        writer = pa.ipc.new_stream(stream, schema)
+
+    for rows in batches:
+        if rows:
+            writer.write_batch(_record_batch(rows, schema))
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+
+    writer.close()
+    yield sink.drain()
+
+
+def iter_export(
+    file_format: str,
+    log: ResultsLog = results_log,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[bytes]:
+    """Streams the results log as encoded chunks, one per record batch."""
+
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {file_format}")
+
+    if file_format != "csv" and not PYARROW_AVAILABLE:
+        raise ValueError(f"pyarrow is required for {file_format} export")
+
+    batches = log.iter_batches(batch_size)
+
+    if file_format == "csv":
+        return _iter_csv(batches)
+
+    return _iter_arrow(batches, file_format)
@@ -0,0 +1,206 @@
+"""
+Scoring Rules
+Loads the versioned scoring rules file, compiles it into integer-indexed
+lookup arrays and threshold vectors, and hot-swaps the compiled rules
+when the file changes on disk.
+"""
+
+from bisect import bisect_right
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import json
+import os
+import time
+
+from app.config import settings
+
+
+BREAKDOWN_ORDER = ("technical", "scale", "economic", "urgency", "organizational")
+ORGANIZATIONAL_FLAGS = ("has_quantum_team", "has_research_partnerships", "has_advanced_hpc")
+
+# Every parameter QuantumAnalyzer reads, per readiness category
+READINESS_PARAMETERS = {
+    "technical_infrastructure": ("base", "per_maturity_point", "max"),
+    "workforce_skills": ("with_it_team", "without_it_team", "per_employee", "employee_cap", "max"),
+    "financial_readiness": ("revenue_share", "ratio_weight", "base", "max"),
+    "leadership_support": ("aware", "unaware"),
+    "strategic_alignment": ("with_use_case", "without_use_case")
+}
+
+DIGEST_LENGTH = 12
+
+# Compiled rule sets kept by version, so an analysis started under one
+# version finishes under it even if the file is swapped mid-request.
+RETAINED_VERSIONS = 8
+
+
+class RulesError(ValueError):
+    """Raised when a rules file is missing fields or inconsistent."""
+
+
+# ============================================================
+# COMPILED TABLES
+# ============================================================
+
+class LookupTable:
+    """Category -> score via an index map into a flat array; default last."""
+
+    __slots__ = ("index", "values")
+
+    def __init__(self, spec: Dict[str, Any]):
+        keys = list(spec["values"])
+        self.index = {key: position for position, key in enumerate(keys)}
+        self.values = tuple(float(spec["values"][key]) for key in keys) + (
+            float(spec["default"]),
+        )
+
+    def __getitem__(self, key: str) -> float:
+        return self.values[self.index.get(key, -1)]
+
+
+class ThresholdTable:
+    """Value -> score by the first threshold the value is below."""
+
+    __slots__ = ("thresholds", "scores")
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.thresholds = tuple(float(t) for t in spec["thresholds"])
+        self.scores = tuple(float(s) for s in spec["scores"])
+
+        if list(self.thresholds) != sorted(self.thresholds):
+            raise RulesError("thresholds must be ascending")
+        if len(self.scores) != len(self.thresholds) + 1:
+            raise RulesError("scores must have one more entry than thresholds")
+
+    def __getitem__(self, value: float) -> float:
+        return self.scores[bisect_right(self.thresholds, value)]
+
+
+class CompiledRules:
+    """
+    Immutable, evaluation-ready form of one rules file version. The
+    version is the file's version plus a hash of its content, so an edit
+    that forgets to bump the version still gets its own cache keys.
+    """
+
+    def __init__(self, spec: Dict[str, Any], digest: str = ""):
+        self.digest = digest
+        try:
+            self.label = str(spec["version"])
+            self.version = f"{self.label}+{digest[:DIGEST_LENGTH]}" if digest else self.label
+            self.technical = LookupTable(spec["technical"])
+            self.scale = LookupTable(spec["scale"])
+            self.urgency = LookupTable(spec["urgency"])
+            self.economic = ThresholdTable(spec["economic"])
+
+            organizational = spec["organizational"]
+            self.organizational_base = float(organizational["base"])
+            self.organizational_max = float(organizational["max"])
+            self.organizational_bonuses: Tuple[float, ...] = tuple(
+                float(organizational["bonuses"][flag]) for flag in ORGANIZATIONAL_FLAGS
+            )
+
+            weights = spec["suitability_weights"]
+            self.suitability_weights: Tuple[float, ...] = tuple(
+                float(weights[component]) for component in BREAKDOWN_ORDER
+            )
+
+            self.readiness = _compile_readiness(spec["readiness"])
+        except (KeyError, TypeError, AttributeError) as e:
+            raise RulesError(f"Invalid scoring rules: {e!r}") from e
+
+
+def _compile_readiness(spec: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """Checks every category and parameter the analyzer reads is present."""
+
+    if not isinstance(spec, dict):
+        raise RulesError("readiness must be an object")
+
+    readiness = {}
+    for category, names in READINESS_PARAMETERS.items():
+        params = spec.get(category)
+        if not isinstance(params, dict):
+            raise RulesError(f"readiness.{category} must be an object")
+        missing = [name for name in names if name not in params]
+        if missing:
+            raise RulesError(f"readiness.{category} is missing {', '.join(missing)}")
+        readiness[category] = {name: float(params[name]) for name in names}
+
+    return readiness
+
+
+def compile_rules(path: str) -> CompiledRules:
+    with open(path, "rb") as handle:
+        content = handle.read()
+    return CompiledRules(json.loads(content), hashlib.sha256(content).hexdigest())
+
+
+# ============================================================
+# HOT-SWAPPING REGISTRY
+# ============================================================
+
+class RulesRegistry:
+    """
+    Holds the active compiled rules. At most every check_interval
+    seconds the file's mtime is checked; a changed file is compiled and
+    swapped in with a single reference assignment. A file that fails to
+    compile leaves the previous rules active.
+    """
+
+    def __init__(self, path: str, check_interval: float = 2.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = Lock()
+        self._mtime = os.stat(path).st_mtime
+        self._active = compile_rules(path)
+        self._by_version: "OrderedDict[str, CompiledRules]" = OrderedDict(
+            [(self._active.version, self._active)]
+        )
+        self._next_check = time.monotonic() + check_interval
+        self.last_error: Optional[str] = None
+
+    def get(self, version: Optional[str] = None) -> CompiledRules:
+
+        if time.monotonic() >= self._next_check:
+            self._maybe_reload()
+
+        active = self._active
+        if version is None or version == active.version:
+            return active
+
+        return self._by_version.get(version, active)
+
+    def _maybe_reload(self):
+
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_check:
+                return
+            self._next_check = now + self.check_interval
+
+            try:
+                mtime = os.stat(self.path).st_mtime
+                if mtime == self._mtime:
+                    return
+                compiled = compile_rules(self.path)
+            except Exception as e:
+                # Whatever is wrong with the file, requests keep the old rules
+                self.last_error = str(e)
+                return
+
+            self._mtime = mtime
+            self.last_error = None
+            self._by_version[compiled.version] = compiled
+            self._by_version.move_to_end(compiled.version)
+            while len(self._by_version) > RETAINED_VERSIONS:
+                self._by_version.popitem(last=False)
+            self._active = compiled
+
+
+rules_registry = RulesRegistry(
+    settings.SCORING_RULES_PATH,
+    check_interval=settings.SCORING_RULES_CHECK_INTERVAL
+)
+get_rules = rules_registry.get
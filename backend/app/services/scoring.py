@@ -4,13 +4,24 @@ Enterprise-grade deterministic scoring engine
 with dynamic quantum simulation integration.
 """
 
-from typing import Dict, Any
-import math
+from typing import Dict, Any, Optional, Set, Tuple
 import random
+import time
+
+from app.services.quantum_engine import validate_noise_options
+from app.services.request_log import current_timings
+from app.services.rules import BREAKDOWN_ORDER, CompiledRules, get_rules
+from app.services.resource_estimator import (
+    DEFAULT_PHYSICAL_ERROR_RATE,
+    estimate_resources
+)
 
 # Optional import (safe fallback if Qiskit not installed)
 try:
-    from app.services.quantum_engine import run_dynamic_quantum_simulation
+    from app.services.quantum_engine import (
+        iter_dynamic_quantum_simulation,
+        run_dynamic_quantum_simulation
+    )
     QUANTUM_ENGINE_AVAILABLE = True
 except Exception:
     QUANTUM_ENGINE_AVAILABLE = False
@@ -20,192 +31,184 @@ except Exception:
 # MAIN ENTRY POINT
 # ============================================================
 
-def analyze_company(data: dict) -> Dict[str, Any]:
-
-    # ---- Extract Inputs ----
-    problem_type = data.get("problem_type", "web_backend").lower()
-    scale = data.get("scale", "small").lower()
-    annual_compute_cost = float(data.get("annual_compute_cost", 0))
-    time_sensitivity = data.get("time_sensitivity", "batch").lower()
-    has_quantum_team = bool(data.get("has_quantum_team", False))
-    has_research_partnerships = bool(data.get("has_research_partnerships", False))
-    has_advanced_hpc = bool(data.get("has_advanced_hpc", False))
-    business_criticality = data.get("business_criticality", "low impact").lower()
-    investment_horizon = data.get("investment_horizon", "<2 years").lower()
-
-    # ---- Core Scoring ----
-    technical = _technical_score(problem_type)
-    scale_score = _scale_score(scale)
-    economic = _economic_score(annual_compute_cost)
-    urgency = _urgency_score(time_sensitivity)
-    organizational = _organizational_score(
-        has_quantum_team,
-        has_research_partnerships,
-        has_advanced_hpc
-    )
+def analyze_company(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Analyzes normalized inputs (see normalize_input). They are not
+    normalized again, so the result is computed under the rules_version
+    the caller keyed it on.
+    """
+
+    values, _ = _evaluate_graph(inputs)
+
+    return _assemble_result(values)
+
+
+def reanalyze_company(
+    previous_data: dict,
+    previous_result: Optional[dict],
+    diff: dict,
+    inputs: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Re-runs the analysis for previous_data updated with diff, recomputing
+    only the sections whose inputs changed. Without a previous_result
+    every section is recomputed. Callers that key the result on the
+    updated input pass it, already normalized, as inputs.
+    """
+
+    previous_inputs = normalize_input(previous_data)
+    if inputs is None:
+        inputs = normalize_input({**previous_data, **diff})
+
+    # Sections computed under other scoring rules are stale
+    if previous_result is not None:
+        previous_inputs["rules_version"] = previous_result.get("rules_version")
+
+    if previous_result is None:
+        values, recomputed = _evaluate_graph(inputs)
+    else:
+        changed = {
+            key for key in inputs
+            if inputs[key] != previous_inputs[key]
+        }
+        values, recomputed = _evaluate_graph(
+            inputs,
+            _extract_values(previous_result),
+            changed
+        )
 
-    suitability_score = int(
-        technical * 0.35 +
-        scale_score * 0.20 +
-        economic * 0.20 +
-        urgency * 0.15 +
-        organizational * 0.10
-    )
+    result = _assemble_result(values)
+    result["incremental"] = {
+        "reused_sections": [
+            name for name, _, _ in _ANALYSIS_GRAPH if name not in recomputed
+        ],
+        "recomputed_sections": [
+            name for name, _, _ in _ANALYSIS_GRAPH if name in recomputed
+        ]
+    }
 
-    # ---- Qubit Estimation ----
-    qubit_estimate = _estimate_qubits_by_algorithm(problem_type, scale)
+    return result
 
-    # ---- Dynamic Quantum Simulation (Safe Fallback) ----
-    if QUANTUM_ENGINE_AVAILABLE:
-        quantum_simulation = run_dynamic_quantum_simulation(scale, suitability_score)
-    else:
-        quantum_simulation = _mock_quantum_simulation(scale)
 
-    # ---- Hardware Feasibility ----
-    hardware_feasibility = _hardware_feasibility(
-        qubit_estimate["physical_qubits"]
-    )
+def normalize_input(data: dict) -> Dict[str, Any]:
 
-    # ---- ROI ----
-    confidence_band = _roi_confidence(suitability_score, annual_compute_cost)
+    noise_profile = (data.get("noise_profile") or "").lower() or None
+    simulation_method = data.get("simulation_method", "density_matrix").lower()
+    validate_noise_options(noise_profile, simulation_method)
+
+    physical_error_rate = float(
+        data.get("physical_error_rate", DEFAULT_PHYSICAL_ERROR_RATE)
+    )
+    if not 0 < physical_error_rate < 1:
+        raise ValueError("physical_error_rate must be between 0 and 1")
 
-    # ---- Return Everything ----
     return {
-        "suitability_score": suitability_score,
-        "risk_level": _risk_level(suitability_score),
-        "breakdown": {
-            "technical": technical,
-            "scale": scale_score,
-            "economic": economic,
-            "urgency": urgency,
-            "organizational": organizational
-        },
-        "qubit_estimate": qubit_estimate,
-        "hardware_feasibility": hardware_feasibility,
-        "confidence_band": confidence_band,
-        "executive_summary": _generate_executive_summary(
-            suitability_score,
-            business_criticality,
-            investment_horizon
-        ),
-        "classical_alternative": _generate_classical_alternative(problem_type),
-        "technical_analysis": _generate_technical_analysis(problem_type, scale, suitability_score),
-        "economic_analysis": _generate_economic_analysis(annual_compute_cost, suitability_score),
-        "migration_roadmap": _generate_migration_roadmap(suitability_score),
-        "risk_assessment": _generate_risk_assessment(suitability_score, organizational),
-        "quantum_simulation": quantum_simulation
+        "problem_type": data.get("problem_type", "web_backend").lower(),
+        "scale": data.get("scale", "small").lower(),
+        "annual_compute_cost": float(data.get("annual_compute_cost", 0)),
+        "time_sensitivity": data.get("time_sensitivity", "batch").lower(),
+        "has_quantum_team": bool(data.get("has_quantum_team", False)),
+        "has_research_partnerships": bool(data.get("has_research_partnerships", False)),
+        "has_advanced_hpc": bool(data.get("has_advanced_hpc", False)),
+        "business_criticality": data.get("business_criticality", "low impact").lower(),
+        "investment_horizon": data.get("investment_horizon", "<2 years").lower(),
+        "noise_profile": noise_profile,
+        "simulation_method": simulation_method,
+        "physical_error_rate": physical_error_rate,
+        "rules_version": get_rules().version
     }
 
 
 # ============================================================
-# SCORING FUNCTIONS
+# STREAMING ENTRY POINTS
 # ============================================================
 
-def _technical_score(problem_type: str) -> float:
-    mapping = {
-        "molecular_simulation": 95,
-        "cryptography": 90,
-        "optimization": 85,
-        "search": 75,
-        "machine_learning": 40,
-        "web_backend": 5
-    }
-    return float(mapping.get(problem_type, 5))
+def score_sections(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Evaluates every section that does not depend on the quantum
+    simulation. Returns graph values for finish_analysis.
+    """
 
+    values, _ = _evaluate_graph(inputs, deferred={"quantum_simulation"})
+    return values
 
-def _scale_score(scale: str) -> float:
-    mapping = {
-        "massive": 90,
-        "large": 70,
-        "medium": 40,
-        "small": 10
-    }
-    return float(mapping.get(scale, 10))
 
+def partial_result(values: Dict[str, Any]) -> Dict[str, Any]:
+    return _assemble_result(values)
 
-def _economic_score(cost: float) -> float:
-    if cost < 100_000:
-        return 10.0
-    elif cost < 1_000_000:
-        return 40.0
-    elif cost < 10_000_000:
-        return 70.0
-    else:
-        return 90.0
 
+def iter_quantum_simulation(inputs: Dict[str, Any], score: int, shots: int, batch_size: int):
+    """Yields cumulative simulation results, one per shot batch."""
 
-def _urgency_score(time_sensitivity: str) -> float:
-    mapping = {
-        "batch": 85,
-        "hours": 70,
-        "minutes": 40,
-        "real_time": 10
-    }
-    return float(mapping.get(time_sensitivity, 85))
-
+    if QUANTUM_ENGINE_AVAILABLE:
+        yield from iter_dynamic_quantum_simulation(
+            inputs["scale"],
+            score,
+            noise_profile=inputs["noise_profile"],
+            method=inputs["simulation_method"],
+            shots=shots,
+            batch_size=batch_size
+        )
+    else:
+        yield _mock_quantum_simulation(inputs["scale"])
 
-def _organizational_score(
-    has_quantum_team: bool,
-    has_research_partnerships: bool,
-    has_advanced_hpc: bool
-) -> float:
 
-    score = 20.0
-    if has_quantum_team:
-        score += 30
-    if has_research_partnerships:
-        score += 25
-    if has_advanced_hpc:
-        score += 25
+def finish_analysis(values: Dict[str, Any], quantum_simulation: dict) -> Dict[str, Any]:
+    """Completes score_sections values with a finished simulation."""
 
-    return min(score, 100.0)
+    values = {**values, "quantum_simulation": quantum_simulation}
+    values, _ = _evaluate_graph(values, previous=values)
+    return _assemble_result(values)
 
 
 # ============================================================
-# QUBIT ESTIMATION
+# SCORING FUNCTIONS
 # ============================================================
 
-def _estimate_qubits_by_algorithm(problem_type: str, scale: str):
+def _technical_score(rules: CompiledRules, problem_type: str) -> float:
+    return rules.technical[problem_type]
 
-    problem_size = {
-        "small": 100,
-        "medium": 1000,
-        "large": 10000,
-        "massive": 100000
-    }
 
-    size = problem_size.get(scale, 1000)
+def _scale_score(rules: CompiledRules, scale: str) -> float:
+    return rules.scale[scale]
 
-    logical_qubits = 0
-    algorithm_used = "Not Applicable"
 
-    if problem_type == "optimization":
-        logical_qubits = size
-        algorithm_used = "QAOA"
+def _economic_score(rules: CompiledRules, cost: float) -> float:
+    return rules.economic[cost]
 
-    elif problem_type == "search":
-        logical_qubits = math.ceil(math.log2(size))
-        algorithm_used = "Grover"
 
-    elif problem_type == "cryptography":
-        logical_qubits = size // 2
-        algorithm_used = "Shor"
+def _urgency_score(rules: CompiledRules, time_sensitivity: str) -> float:
+    return rules.urgency[time_sensitivity]
 
-    elif problem_type == "molecular_simulation":
-        logical_qubits = int(size * 0.05)
-        algorithm_used = "VQE"
 
-    elif problem_type == "machine_learning":
-        logical_qubits = int(size * 0.01)
-        algorithm_used = "Variational Quantum Circuit"
+def _organizational_score(
+    rules: CompiledRules,
+    has_quantum_team: bool,
+    has_research_partnerships: bool,
+    has_advanced_hpc: bool
+) -> float:
 
-    physical_qubits = logical_qubits * 1000  # error correction factor
+    score = rules.organizational_base
+    for present, bonus in zip(
+        (has_quantum_team, has_research_partnerships, has_advanced_hpc),
+        rules.organizational_bonuses
+    ):
+        if present:
+            score += bonus
 
-    return {
-        "algorithm_used": algorithm_used,
-        "logical_qubits": logical_qubits,
-        "physical_qubits": physical_qubits
-    }
+    return min(score, rules.organizational_max)
+
+
+# ============================================================
+# QUBIT ESTIMATION
+# ============================================================
+
+def _estimate_qubits_by_algorithm(
+    problem_type: str,
+    scale: str,
+    physical_error_rate: float = DEFAULT_PHYSICAL_ERROR_RATE
+):
+    return estimate_resources(problem_type, scale, physical_error_rate)
 
 
 # ============================================================
@@ -238,18 +241,66 @@ def _mock_quantum_simulation(scale: str):
 # HARDWARE
 # ============================================================
 
-def _hardware_feasibility(physical_qubits: int) -> str:
+def _hardware_feasibility(qubit_estimate: dict, simulation: dict = None) -> str:
 
-    if physical_qubits == 0:
+    if qubit_estimate["logical_qubits"] == 0:
         return "Quantum computing not applicable."
 
+    if qubit_estimate["code_distance"] is None:
+        return (
+            "Not feasible: physical error rate too high for surface-code "
+            "error correction at this problem size."
+        )
+
+    physical_qubits = qubit_estimate["physical_qubits"]
+    runtime = qubit_estimate["runtime_seconds"]
+
     if physical_qubits < 1_000_000:
-        return "Feasible for experimental cloud quantum platforms."
+        verdict = "Feasible for experimental cloud quantum platforms."
+    elif physical_qubits < 100_000_000:
+        verdict = "Requires significant hardware scaling beyond NISQ systems."
+    else:
+        verdict = "Not feasible with current hardware maturity."
+
+    if runtime > 365 * 24 * 3600:
+        verdict += " Estimated runtime exceeds one year."
+
+    verdict += (
+        f" Code distance {qubit_estimate['code_distance']}, "
+        f"estimated runtime {_format_duration(runtime)}."
+    )
+
+    return verdict + _simulated_fidelity_note(simulation)
 
-    if physical_qubits < 100_000_000:
-        return "Requires significant hardware scaling beyond NISQ systems."
 
-    return "Not feasible with current hardware maturity."
+def _format_duration(seconds: float) -> str:
+
+    for unit, size in (("days", 86400), ("hours", 3600), ("minutes", 60)):
+        if seconds >= size:
+            return f"{seconds / size:.1f} {unit}"
+
+    if seconds >= 1:
+        return f"{seconds:.1f} seconds"
+
+    return f"{seconds * 1000:.2f} ms"
+
+
+def _simulated_fidelity_note(simulation: dict) -> str:
+
+    if not simulation or not simulation.get("noise_profile"):
+        return ""
+
+    fidelity = simulation.get("fidelity")
+    profile = simulation["noise_profile"].replace("_", " ")
+
+    if fidelity >= 0.95:
+        outlook = "noise is tolerable at this circuit size"
+    elif fidelity >= 0.8:
+        outlook = "noise noticeably degrades results"
+    else:
+        outlook = "noise dominates the output distribution"
+
+    return f" Simulated fidelity on {profile} hardware: {fidelity} ({outlook})."
 
 
 # ============================================================
@@ -359,3 +410,195 @@ def _generate_risk_assessment(score: int, org_score: float):
         {"risk": "Talent Gap", "level": "High" if org_score < 50 else "Medium"},
         {"risk": "Vendor Lock-in", "level": "Medium"}
     ]
+
+
+# ============================================================
+# DEPENDENCY GRAPH
+# ============================================================
+
+_BREAKDOWN_COMPONENTS = BREAKDOWN_ORDER
+
+
+def _suitability_score(rules: CompiledRules, *components: float) -> int:
+    return int(sum(
+        score * weight
+        for score, weight in zip(components, rules.suitability_weights)
+    ))
+
+
+def _quantum_simulation(
+    scale: str,
+    suitability_score: int,
+    noise_profile,
+    simulation_method: str
+):
+    # ---- Dynamic Quantum Simulation (Safe Fallback) ----
+    if QUANTUM_ENGINE_AVAILABLE:
+        return run_dynamic_quantum_simulation(
+            scale,
+            suitability_score,
+            noise_profile=noise_profile,
+            method=simulation_method
+        )
+    return _mock_quantum_simulation(scale)
+
+
+# (section, function, dependencies) in topological order. Dependencies
+# name either normalized inputs, "rules" (the compiled rules for the
+# input's rules_version) or earlier sections, and are passed
+# positionally to the function.
+_ANALYSIS_GRAPH = (
+    ("breakdown.technical", _technical_score, ("rules", "problem_type")),
+    ("breakdown.scale", _scale_score, ("rules", "scale")),
+    ("breakdown.economic", _economic_score, ("rules", "annual_compute_cost")),
+    ("breakdown.urgency", _urgency_score, ("rules", "time_sensitivity")),
+    ("breakdown.organizational", _organizational_score, (
+        "rules",
+        "has_quantum_team",
+        "has_research_partnerships",
+        "has_advanced_hpc"
+    )),
+    ("suitability_score", _suitability_score, ("rules",) + tuple(
+        f"breakdown.{component}" for component in _BREAKDOWN_COMPONENTS
+    )),
+    ("risk_level", _risk_level, ("suitability_score",)),
+    ("qubit_estimate", _estimate_qubits_by_algorithm, (
+        "problem_type",
+        "scale",
+        "physical_error_rate"
+    )),
+    ("quantum_simulation", _quantum_simulation, (
+        "scale",
+        "suitability_score",
+        "noise_profile",
+        "simulation_method"
+    )),
+    ("hardware_feasibility", _hardware_feasibility, (
+        "qubit_estimate",
+        "quantum_simulation"
+    )),
+    ("confidence_band", _roi_confidence, (
+        "suitability_score",
+        "annual_compute_cost"
+    )),
+    ("executive_summary", _generate_executive_summary, (
+        "suitability_score",
+        "business_criticality",
+        "investment_horizon"
+    )),
+    ("classical_alternative", _generate_classical_alternative, (
+        "problem_type",
+    )),
+    ("technical_analysis", _generate_technical_analysis, (
+        "problem_type",
+        "scale",
+        "suitability_score"
+    )),
+    ("economic_analysis", _generate_economic_analysis, (
+        "annual_compute_cost",
+        "suitability_score"
+    )),
+    ("migration_roadmap", _generate_migration_roadmap, (
+        "suitability_score",
+    )),
+    ("risk_assessment", _generate_risk_assessment, (
+        "suitability_score",
+        "breakdown.organizational"
+    ))
+)
+
+
+def _evaluate_graph(
+    inputs: Dict[str, Any],
+    previous: Optional[Dict[str, Any]] = None,
+    changed: Optional[Set[str]] = None,
+    deferred: Set[str] = frozenset()
+) -> Tuple[Dict[str, Any], Set[str]]:
+    """
+    Evaluates the graph, reusing previous section values whose
+    dependencies are unchanged. A recomputed section that yields the
+    same value as before does not invalidate its dependents. Deferred
+    sections, and everything depending on them, are left out.
+    Per-section timings go to the request log when it is sampling.
+    Returns (values, recomputed section names).
+    """
+
+    timings = current_timings()
+
+    values = dict(inputs)
+    values["rules"] = get_rules(inputs["rules_version"])
+    dirty = set(changed or ())
+    if "rules_version" in dirty:
+        dirty.add("rules")
+    skipped = set(deferred)
+    recomputed = set()
+
+    for name, function, dependencies in _ANALYSIS_GRAPH:
+        if name in skipped or not skipped.isdisjoint(dependencies):
+            skipped.add(name)
+            continue
+
+        if previous is not None and name in previous and dirty.isdisjoint(dependencies):
+            values[name] = previous[name]
+            continue
+
+        if timings is None:
+            values[name] = function(*(values[dep] for dep in dependencies))
+        else:
+            start = time.perf_counter()
+            values[name] = function(*(values[dep] for dep in dependencies))
+            timings[name] = round((time.perf_counter() - start) * 1000, 3)
+        recomputed.add(name)
+
+        if previous is None or values[name] != previous.get(name):
+            dirty.add(name)
+
+    return values, recomputed
+
+
+def _extract_values(result: dict) -> Dict[str, Any]:
+
+    values = {
+        name: result[name]
+        for name, _, _ in _ANALYSIS_GRAPH
+        if name in result
+    }
+    for component, score in result.get("breakdown", {}).items():
+        values[f"breakdown.{component}"] = score
+
+    return values
+
+
+_RESULT_SECTIONS = (
+    "suitability_score",
+    "risk_level",
+    "breakdown",
+    "qubit_estimate",
+    "hardware_feasibility",
+    "confidence_band",
+    "executive_summary",
+    "classical_alternative",
+    "technical_analysis",
+    "economic_analysis",
+    "migration_roadmap",
+    "risk_assessment",
+    "quantum_simulation"
+)
+
+
+def _assemble_result(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Response dict in the public key order; sections not yet evaluated are omitted."""
+
+    # ---- Return Everything ----
+    result = {}
+    for section in _RESULT_SECTIONS:
+        if section == "breakdown":
+            result["breakdown"] = {
+                component: values[f"breakdown.{component}"]
+                for component in _BREAKDOWN_COMPONENTS
+            }
+        elif section in values:
+            result[section] = values[section]
+
+    result["rules_version"] = values["rules_version"]
+    return result
@@ -0,0 +1,175 @@
+"""
+Shared Result Cache
+Fixed-size hash table in a memory-mapped local file, shared by every
+worker process on the host.
+
+Layout: a header followed by `slots` fixed-size slots. Each key hashes
+to a window of PROBE_WINDOW consecutive slots; a full window evicts
+its least recently used slot. All operations run under an exclusive
+file lock, so updates are atomic across processes.
+"""
+
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Optional
+import json
+import mmap
+import os
+import struct
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # No cross-process locking (e.g. Windows): safe for a single worker only
+    FCNTL_AVAILABLE = False
+
+
+_MAGIC = b"QRACACHE"
+_VERSION = 1
+# magic, version, slots, slot_size, clock
+_HEADER = struct.Struct("<8sIIIQ")
+_HEADER_SIZE = 64
+# key, last-used stamp, payload length
+_SLOT_HEADER = struct.Struct("<16sQI")
+
+PROBE_WINDOW = 8
+
+_EMPTY_KEY = b"\0" * 16
+
+
+class SharedCache:
+    """Cross-process key -> JSON value cache backed by a mapped file."""
+
+    def __init__(self, path: str, slots: int = 4096, slot_size: int = 8192):
+        self.path = path
+        self.slots = slots
+        self.slot_size = slot_size
+        self.max_payload = slot_size - _SLOT_HEADER.size
+        self._lock = Lock()
+        self._fd = None
+        self._mm = None
+        self._pid = None
+
+    # ---- Public API ----
+
+    def get(self, key: str) -> Optional[Any]:
+
+        key_bytes = bytes.fromhex(key)[:16]
+
+        with self._locked() as mm:
+            index = self._find(mm, key_bytes)
+            if index is None:
+                return None
+
+            offset = self._slot_offset(index)
+            _, _, length = _SLOT_HEADER.unpack_from(mm, offset)
+            payload = mm[offset + _SLOT_HEADER.size:offset + _SLOT_HEADER.size + length]
+            _SLOT_HEADER.pack_into(mm, offset, key_bytes, self._tick(mm), length)
+
+        return json.loads(payload)
+
+    def put(self, key: str, value: Any) -> bool:
+        """Stores value; returns False if it does not fit in a slot."""
+
+        payload = json.dumps(value, separators=(",", ":")).encode()
+        if len(payload) > self.max_payload:
+            return False
+
+        key_bytes = bytes.fromhex(key)[:16]
+
+        with self._locked() as mm:
+            index = self._find(mm, key_bytes)
+            if index is None:
+                index = self._victim(mm, key_bytes)
+
+            offset = self._slot_offset(index)
+            start = offset + _SLOT_HEADER.size
+            mm[start:start + len(payload)] = payload
+            _SLOT_HEADER.pack_into(mm, offset, key_bytes, self._tick(mm), len(payload))
+
+        return True
+
+    # ---- Slot Lookup ----
+
+    def _window(self, key_bytes: bytes):
+        start = int.from_bytes(key_bytes[:8], "little") % self.slots
+        return [(start + i) % self.slots for i in range(min(PROBE_WINDOW, self.slots))]
+
+    def _slot_offset(self, index: int) -> int:
+        return _HEADER_SIZE + index * self.slot_size
+
+    def _find(self, mm, key_bytes: bytes) -> Optional[int]:
+
+        for index in self._window(key_bytes):
+            slot_key, _, _ = _SLOT_HEADER.unpack_from(mm, self._slot_offset(index))
+            if slot_key == key_bytes:
+                return index
+
+        return None
+
+    def _victim(self, mm, key_bytes: bytes) -> int:
+        """Empty slot in the key's window, else the least recently used."""
+
+        oldest_index, oldest_stamp = None, None
+
+        for index in self._window(key_bytes):
+            slot_key, stamp, _ = _SLOT_HEADER.unpack_from(mm, self._slot_offset(index))
+            if slot_key == _EMPTY_KEY:
+                return index
+            if oldest_stamp is None or stamp < oldest_stamp:
+                oldest_index, oldest_stamp = index, stamp
+
+        return oldest_index
+
+    def _tick(self, mm) -> int:
+
+        magic, version, slots, slot_size, clock = _HEADER.unpack_from(mm, 0)
+        clock += 1
+        _HEADER.pack_into(mm, 0, magic, version, slots, slot_size, clock)
+        return clock
+
+    # ---- File Mapping & Locking ----
+
+    def _open(self):
+        """Maps the file, (re)initializing it if missing or incompatible."""
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        size = _HEADER_SIZE + self.slots * self.slot_size
+
+        self._flock(fd, True)
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+            header = os.read(fd, _HEADER.size)
+            expected = (_MAGIC, _VERSION, self.slots, self.slot_size)
+
+            if len(header) < _HEADER.size or _HEADER.unpack(header)[:4] != expected:
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, size)
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.write(fd, _HEADER.pack(*expected, 0))
+        finally:
+            self._flock(fd, False)
+
+        self._fd = fd
+        self._mm = mmap.mmap(fd, size)
+        self._pid = os.getpid()
+
+    def _flock(self, fd, acquire: bool):
+        if FCNTL_AVAILABLE:
+            fcntl.flock(fd, fcntl.LOCK_EX if acquire else fcntl.LOCK_UN)
+
+    @contextmanager
+    def _locked(self):
+        """Thread lock plus exclusive file lock around a mapped-file operation."""
+
+        with self._lock:
+            # Re-map after fork so workers never share a descriptor
+            if self._mm is None or self._pid != os.getpid():
+                self._open()
+
+            self._flock(self._fd, True)
+            try:
+                yield self._mm
+            finally:
+                self._flock(self._fd, False)
@@ -0,0 +1,46 @@
+"""
+Bulk Export of Recorded Analyses
+
+    python -m app.tools.export --format parquet --output analyses.parquet
+    python -m app.tools.export --format csv > analyses.csv
+"""
+
+import argparse
+import sys
+
+from app.services.results_export import (
+    DEFAULT_BATCH_SIZE,
+    EXPORT_FORMATS,
+    ResultsLog,
+    iter_export,
+    results_log
+)
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Export recorded analyses")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+    parser.add_argument("--output", help="file to write (default: stdout)")
+    parser.add_argument("--source", help="results log to read (default: RESULTS_LOG_PATH)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    log = ResultsLog(args.source) if args.source else results_log
+
+    try:
+        chunks = iter_export(args.format, log, args.batch_size)
+    except ValueError as e:
+        parser.error(str(e))
+
+    output = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        for chunk in chunks:
+            output.write(chunk)
+    finally:
+        if args.output:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+"""
+Load Generator for /analyze
+
+Drives the API in-process over ASGI or over a real socket, either
+closed-loop at fixed concurrency levels or open-loop at fixed Poisson
+arrival rates, and prints a throughput/latency curve as JSON.
+
+    python -m app.tools.loadtest --transport asgi --mode mock --concurrency 1,8,32
+    python -m app.tools.loadtest --transport socket --port 8000 --rate 50,100,200
+
+Payloads use a random seed unless --seed is given, so repeated runs do
+not replay into a warm cache. In-process runs write their cache and logs
+to a temporary directory, never to the files a live server uses.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+
+MODES = ("qiskit", "mock", "cache")
+
+# Cache mode replays this many distinct payloads so steady state is all hits
+CACHE_POOL_SIZE = 32
+
+
+# ============================================================
+# PAYLOAD GENERATION
+# ============================================================
+
+def _log_uniform_cost(rng: random.Random) -> float:
+    # Spans every _economic_score band; continuous so payloads stay unique
+    return round(10 ** rng.uniform(4, 8), 2)
+
+
+_FIELD_GENERATORS: Dict[str, Callable[[random.Random], Any]] = {
+    "problem_type": lambda rng: rng.choice([
+        "optimization", "search", "cryptography",
+        "molecular_simulation", "machine_learning", "web_backend"
+    ]),
+    "scale": lambda rng: rng.choice(["small", "medium", "large", "massive"]),
+    "annual_compute_cost": _log_uniform_cost,
+    "time_sensitivity": lambda rng: rng.choice(["batch", "hours", "minutes", "real_time"]),
+    "has_quantum_team": lambda rng: rng.random() < 0.2,
+    "has_research_partnerships": lambda rng: rng.random() < 0.35,
+    "has_advanced_hpc": lambda rng: rng.random() < 0.5
+}
+
+
+class PayloadGenerator:
+    """Realistic /analyze bodies covering every field in REQUIRED_FIELDS."""
+
+    def __init__(self, seed: int = 0, pool_size: Optional[int] = None):
+        # Imported here so isolate_app_state() can run before settings load
+        from app.main import REQUIRED_FIELDS
+
+        self._fields = REQUIRED_FIELDS
+        missing = set(REQUIRED_FIELDS) - set(_FIELD_GENERATORS)
+        if missing:
+            raise ValueError(f"No generator for required fields: {sorted(missing)}")
+
+        self._rng = random.Random(seed)
+        self.pool = [self._fresh() for _ in range(pool_size)] if pool_size else None
+
+    def _fresh(self) -> Dict[str, Any]:
+        return {field: _FIELD_GENERATORS[field](self._rng) for field in self._fields}
+
+    def __call__(self) -> Dict[str, Any]:
+        if self.pool:
+            return self._rng.choice(self.pool)
+        return self._fresh()
+
+
+# ============================================================
+# TRANSPORTS
+# ============================================================
+
+# A transport sends one JSON body and returns the HTTP status code.
+Transport = Callable[[bytes], Awaitable[int]]
+
+
+def asgi_transport(app) -> Transport:
+    """Calls the ASGI app directly, without a server or socket."""
+
+    async def send_request(body: bytes) -> int:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/analyze",
+            "raw_path": b"/analyze",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [
+                (b"host", b"loadtest"),
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode())
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": ("loadtest", 80)
+        }
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        status = 0
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        await app(scope, receive, send)
+        return status
+
+    return send_request
+
+
+class _Connection:
+    """One keep-alive HTTP/1.1 connection."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, body: bytes) -> int:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+        try:
+            self.writer.write(
+                b"POST /analyze HTTP/1.1\r\n"
+                b"Host: " + self.host.encode() + b"\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+            )
+            await self.writer.drain()
+
+            status_line = await self.reader.readline()
+            status = int(status_line.split()[1])
+            length = 0
+            while True:
+                line = await self.reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    length = int(value)
+            await self.reader.readexactly(length)
+            return status
+
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+def socket_transport(host: str, port: int) -> Transport:
+    """Real HTTP over TCP from a pool of keep-alive connections."""
+
+    idle: List[_Connection] = []
+
+    async def send_request(body: bytes) -> int:
+        connection = idle.pop() if idle else _Connection(host, port)
+        status = await connection.request(body)
+        idle.append(connection)
+        return status
+
+    return send_request
+
+
+# ============================================================
+# LOAD MODELS
+# ============================================================
+
+async def _timed(transport: Transport, body: bytes, latencies: list, errors: list,
+                 started: Optional[float] = None):
+    # Open-loop requests are timed from their scheduled start, so queueing
+    # delay is included (no coordinated omission).
+    start = started if started is not None else time.perf_counter()
+    try:
+        status = await transport(body)
+        if status >= 400:
+            errors.append(status)
+    except Exception as exc:
+        errors.append(type(exc).__name__)
+    latencies.append(time.perf_counter() - start)
+
+
+async def run_closed_loop(transport: Transport, payloads: PayloadGenerator,
+                          concurrency: int, duration: float) -> Dict[str, Any]:
+
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            body = json.dumps(payloads()).encode()
+            await _timed(transport, body, latencies, errors)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {"concurrency": concurrency, **_summarize(latencies, errors, elapsed)}
+
+
+async def run_open_loop(transport: Transport, payloads: PayloadGenerator,
+                        rate: float, duration: float, seed: int = 0) -> Dict[str, Any]:
+
+    latencies, errors = [], []
+    rng = random.Random(seed)
+    tasks = []
+
+    start = time.perf_counter()
+    next_arrival = start
+    while next_arrival < start + duration:
+        delay = next_arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        body = json.dumps(payloads()).encode()
+        tasks.append(asyncio.ensure_future(
+            _timed(transport, body, latencies, errors, started=next_arrival)
+        ))
+        next_arrival += rng.expovariate(rate)
+
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    return {"target_rps": rate, **_summarize(latencies, errors, elapsed)}
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    # Nearest-rank method
+    rank = max(math.ceil(q / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+
+def _summarize(latencies: List[float], errors: list, elapsed: float) -> Dict[str, Any]:
+
+    ordered = sorted(latencies)
+    total = len(ordered)
+    error_counts: Dict[str, int] = {}
+    for error in errors:
+        error_counts[str(error)] = error_counts.get(str(error), 0) + 1
+
+    return {
+        "requests": total,
+        "errors": len(errors),
+        "error_rate": round(len(errors) / total, 4) if total else 0.0,
+        "error_breakdown": error_counts,
+        "throughput_rps": round((total - len(errors)) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(ordered) / total * 1000, 3) if total else 0.0,
+            "p50": round(_percentile(ordered, 50) * 1000, 3),
+            "p95": round(_percentile(ordered, 95) * 1000, 3),
+            "p99": round(_percentile(ordered, 99) * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3) if total else 0.0
+        }
+    }
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+# Settings that point at files shared with a live server on this host
+_ISOLATED_PATHS = {
+    "SHARED_CACHE_PATH": "cache.bin",
+    "RESULTS_LOG_PATH": "results.jsonl",
+    "ANALYTICS_SNAPSHOT_PATH": "analytics.json",
+    "REQUEST_LOG_DIR": "requests"
+}
+
+
+def isolate_app_state() -> str:
+    """
+    Points the app's cache and logs at a fresh temporary directory, so
+    in-process results (mock ones especially) never reach the files a
+    live server reads. Must run before the app's settings are loaded.
+    """
+
+    if "app.config" in sys.modules:
+        raise RuntimeError("isolate_app_state() must run before app.config is imported")
+
+    directory = tempfile.mkdtemp(prefix="quantum_readiness_loadtest_")
+    for name, filename in _ISOLATED_PATHS.items():
+        os.environ[name] = os.path.join(directory, filename)
+    return directory
+
+
+def _configure_mode(mode: str, transport_name: str, seed: int) -> PayloadGenerator:
+    """In-process only: mock mode disables the quantum engine."""
+
+    if transport_name == "asgi":
+        from app.services import scoring
+        if mode == "mock":
+            scoring.QUANTUM_ENGINE_AVAILABLE = False
+
+    return PayloadGenerator(seed, pool_size=CACHE_POOL_SIZE if mode == "cache" else None)
+
+
+async def run(args) -> Dict[str, Any]:
+
+    if args.transport == "asgi":
+        from app.main import app
+        transport = asgi_transport(app)
+        target = "asgi://app.main:app"
+    else:
+        transport = socket_transport(args.host, args.port)
+        target = f"http://{args.host}:{args.port}/analyze"
+
+    payloads = _configure_mode(args.mode, args.transport, args.seed)
+
+    if args.mode == "cache":
+        for body in payloads.pool:
+            await transport(json.dumps(body).encode())
+
+    points = []
+    if args.rate:
+        for rate in args.rate:
+            points.append(
+                await run_open_loop(transport, payloads, rate, args.duration, args.seed)
+            )
+    else:
+        for concurrency in args.concurrency:
+            points.append(await run_closed_loop(transport, payloads, concurrency, args.duration))
+
+    from app.services.quantum_engine import QISKIT_AVAILABLE
+
+    return {
+        "target": target,
+        "mode": args.mode,
+        "seed": args.seed,
+        "load_model": "open_loop" if args.rate else "closed_loop",
+        "duration_seconds": args.duration,
+        "qiskit_available": QISKIT_AVAILABLE,
+        "curve": points
+    }
+
+
+def _number_list(cast):
+    return lambda text: [cast(part) for part in text.split(",") if part]
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Load test the /analyze endpoint")
+    parser.add_argument("--transport", choices=("asgi", "socket"), default="asgi")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--mode", choices=MODES, default="qiskit",
+                        help="mock requires --transport asgi")
+    parser.add_argument("--concurrency", type=_number_list(int), default=[1, 4, 16],
+                        help="closed-loop concurrency levels, e.g. 1,4,16")
+    parser.add_argument("--rate", type=_number_list(float),
+                        help="open-loop arrival rates in req/s, e.g. 50,100")
+    parser.add_argument("--duration", type=float, default=10.0,
+                        help="seconds per curve point")
+    parser.add_argument("--seed", type=int,
+                        help="payload seed (default: random, so runs do not replay)")
+    parser.add_argument("--output", help="write JSON report to this file")
+    args = parser.parse_args(argv)
+
+    if args.seed is None:
+        args.seed = random.randrange(2 ** 32)
+
+    # A remote server cannot be switched to the mock engine from here
+    if args.mode == "mock" and args.transport != "asgi":
+        parser.error("--mode mock requires --transport asgi")
+
+    state_dir = isolate_app_state() if args.transport == "asgi" else None
+    try:
+        report = asyncio.run(run(args))
+    finally:
+        if state_dir:
+            shutil.rmtree(state_dir, ignore_errors=True)
+
+    text = json.dumps(report, indent=2)
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(text)
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
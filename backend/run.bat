@@ -18,7 +18,8 @@ REM Install dependencies
 echo 📚 Installing dependencies...
 pip install -r requirements.txt
 
-REM Run the application
+REM Run the application (single worker: the shared result cache needs
+REM cross-process file locking, which is only available on Unix)
 echo ⚛️ Starting FastAPI server on http://localhost:8000
 echo 📖 API docs available at http://localhost:8000/docs
 echo.
@@ -18,8 +18,13 @@ source venv/bin/activate
 echo "📚 Installing dependencies..."
 pip install -r requirements.txt
 
-# Run the application
+# Run the application (WORKERS>1 runs multiple processes sharing the result cache)
+WORKERS=${WORKERS:-1}
 echo "⚛️ Starting FastAPI server on http://localhost:8000"
 echo "📖 API docs available at http://localhost:8000/docs"
 echo ""
-python -m uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
+if [ "$WORKERS" -gt 1 ]; then
+    python -m uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers "$WORKERS"
+else
+    python -m uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
+fi
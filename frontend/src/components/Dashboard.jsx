@@ -1,4 +1,5 @@
 import React from "react";
+import { BarChart, Bar, XAxis, YAxis, Tooltip, ResponsiveContainer } from "recharts";
 
 function getScoreColor(score) {
   if (!score && score !== 0) return "text-gray-400";
@@ -19,6 +20,9 @@ function Dashboard({ data }) {
   const roadmap = data.migration_roadmap || [];
   const risks = data.risk_assessment || [];
   const quantum = data.quantum_simulation || {};
+  const measurements = Object.entries(quantum.measurement_distribution || {})
+    .sort(([a], [b]) => a.localeCompare(b))
+    .map(([state, count]) => ({ state, count }));
 
   return (
     <div className="min-h-screen bg-gray-950 text-gray-200 p-10">
@@ -84,16 +88,27 @@ function Dashboard({ data }) {
           <p>
             Physical Qubits:{" "}
             <span className="text-blue-400 font-semibold">
-              {qubits.physical_qubits?.toLocaleString()}
+              {qubits.physical_qubits != null
+                ? qubits.physical_qubits.toLocaleString()
+                : "Not reachable"}
             </span>
           </p>
 
           <p className="mt-3 text-gray-400">
-            {data.hardware_feasibility}
+            {data.hardware_feasibility ?? "Hardware feasibility pending simulation..."}
           </p>
         </div>
 
         {/* Quantum Simulation Demo */}
+        {!data.quantum_simulation && (
+          <div className="bg-indigo-900 p-8 rounded-2xl shadow-xl">
+            <h2 className="text-xl font-semibold mb-4">
+              Quantum Simulation Demo
+            </h2>
+            <p className="text-gray-300">Running simulation...</p>
+          </div>
+        )}
+
         {quantum.qubits_used && (
           <div className="bg-indigo-900 p-8 rounded-2xl shadow-xl">
             <h2 className="text-xl font-semibold mb-4">
@@ -103,6 +118,31 @@ function Dashboard({ data }) {
             <p>Qubits Used: {quantum.qubits_used}</p>
             <p>Measured State: {quantum.measured_state}</p>
             <p>Probability: {quantum.probability}</p>
+            {quantum.shots && (
+              <p>
+                Shots: {quantum.shots.toLocaleString()}
+                {quantum.status === "running" && " (running...)"}
+              </p>
+            )}
+            {quantum.noise_profile && (
+              <p>
+                Fidelity ({quantum.noise_profile.replace(/_/g, " ")}):{" "}
+                {quantum.fidelity}
+              </p>
+            )}
+
+            {measurements.length > 0 && (
+              <div className="mt-6 h-64">
+                <ResponsiveContainer width="100%" height="100%">
+                  <BarChart data={measurements}>
+                    <XAxis dataKey="state" stroke="#a5b4fc" />
+                    <YAxis stroke="#a5b4fc" />
+                    <Tooltip />
+                    <Bar dataKey="count" fill="#818cf8" isAnimationActive={false} />
+                  </BarChart>
+                </ResponsiveContainer>
+              </div>
+            )}
           </div>
         )}
 
@@ -1,10 +1,7 @@
 import React, { useState } from "react";
-import { analyzeQuantumSuitability } from "../services/api";
 
-function CompanyForm({ onAnalysisComplete }) {
+function CompanyForm({ onSubmit }) {
   const [step, setStep] = useState(1);
-  const [loading, setLoading] = useState(false);
-  const [error, setError] = useState("");
 
   const [formData, setFormData] = useState({
     company_name: "",
@@ -36,19 +33,8 @@ function CompanyForm({ onAnalysisComplete }) {
   const nextStep = () => setStep((prev) => prev + 1);
   const prevStep = () => setStep((prev) => prev - 1);
 
-  const handleSubmit = async () => {
-    setLoading(true);
-    setError("");
-
-    try {
-      const result = await analyzeQuantumSuitability(formData);
-      onAnalysisComplete(result);
-    } catch (err) {
-      setError("Analysis failed.");
-    } finally {
-      setLoading(false);
-    }
-  };
+  // The analysis itself is streamed by the Analysis page
+  const handleSubmit = () => onSubmit(formData);
 
   const progressWidth = `${(step / 3) * 100}%`;
 
@@ -68,12 +54,6 @@ function CompanyForm({ onAnalysisComplete }) {
         </p>
       </div>
 
-      {error && (
-        <div className="mb-4 p-4 bg-red-900 text-red-200 rounded-lg">
-          {error}
-        </div>
-      )}
-
       {/* STEP 1 – BUSINESS */}
       {step === 1 && (
         <div className="space-y-6">
@@ -216,10 +196,9 @@ function CompanyForm({ onAnalysisComplete }) {
             </button>
             <button
               onClick={handleSubmit}
-              disabled={loading}
               className="bg-indigo-600 px-6 py-2 rounded-lg"
             >
-              {loading ? "Analyzing..." : "Generate Report"}
+              Generate Report
             </button>
           </div>
         </div>
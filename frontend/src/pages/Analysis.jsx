@@ -1,18 +1,31 @@
 import { useLocation, useNavigate } from "react-router-dom";
 import { useEffect, useState } from "react";
 import Dashboard from "../components/Dashboard";
+import { streamQuantumAnalysis } from "../services/api";
 
 function Analysis() {
   const location = useLocation();
   const navigate = useNavigate();
 
   const [data, setData] = useState(null);
+  const [error, setError] = useState("");
 
   useEffect(() => {
-    // First try router state
-    if (location.state?.data) {
-      setData(location.state.data);
-      return;
+    // Stream a new analysis submitted from the form
+    if (location.state?.formData) {
+      setData(null);
+      setError("");
+
+      return streamQuantumAnalysis(location.state.formData, {
+        onScores: (scores) => setData(scores),
+        onSimulation: (simulation) =>
+          setData((prev) => ({ ...prev, quantum_simulation: simulation })),
+        onComplete: (result) => {
+          sessionStorage.setItem("analysisResult", JSON.stringify(result));
+          setData(result);
+        },
+        onError: () => setError("Analysis failed."),
+      });
     }
 
     // Fallback to sessionStorage
@@ -26,6 +39,14 @@ function Analysis() {
     navigate("/");
   }, [location.state, navigate]);
 
+  if (error) {
+    return (
+      <div className="min-h-screen bg-gray-950 text-white flex items-center justify-center">
+        <h2 className="text-xl text-red-300">{error}</h2>
+      </div>
+    );
+  }
+
   if (!data) {
     return (
       <div className="min-h-screen bg-gray-950 text-white flex items-center justify-center">
@@ -5,12 +5,10 @@ import CompanyForm from "../components/Form";
 function Home() {
   const navigate = useNavigate();
 
-  const handleAnalysisComplete = (result) => {
-    // Save to session storage
-    sessionStorage.setItem("analysisResult", JSON.stringify(result));
-
-    // Pass via router state
-    navigate("/analysis", { state: { data: result } });
+  const handleSubmit = (formData) => {
+    // Analysis page streams the result for this input
+    sessionStorage.removeItem("analysisResult");
+    navigate("/analysis", { state: { formData } });
   };
 
   return (
@@ -19,7 +17,7 @@ function Home() {
         Quantum Readiness Analyzer
       </h1>
 
-      <CompanyForm onAnalysisComplete={handleAnalysisComplete} />
+      <CompanyForm onSubmit={handleSubmit} />
     </div>
   );
 }
@@ -1,5 +1,7 @@
+const API_URL = "http://127.0.0.1:9800";
+
 export async function analyzeQuantumSuitability(formData) {
-  const response = await fetch("http://127.0.0.1:9800/analyze", {
+  const response = await fetch(`${API_URL}/analyze`, {
     method: "POST",
     headers: {
       "Content-Type": "application/json",
@@ -13,3 +15,40 @@ export async function analyzeQuantumSuitability(formData) {
 
   return await response.json();
 }
+
+// Streams an analysis over WebSocket: onScores receives the deterministic
+// sections first, onSimulation the cumulative shot counts as they arrive,
+// onComplete the full result. Returns a function that closes the stream.
+export function streamQuantumAnalysis(
+  formData,
+  { onScores, onSimulation, onComplete, onError }
+) {
+  const socket = new WebSocket(`${API_URL.replace(/^http/, "ws")}/ws/analyze`);
+  let finished = false;
+
+  socket.onopen = () => socket.send(JSON.stringify(formData));
+
+  socket.onmessage = (event) => {
+    const message = JSON.parse(event.data);
+
+    if (message.type === "scores") onScores?.(message.data);
+    if (message.type === "simulation") onSimulation?.(message.data);
+    if (message.type === "complete") {
+      finished = true;
+      onComplete?.(message.data);
+    }
+    if (message.type === "error") {
+      finished = true;
+      onError?.(new Error(message.detail));
+    }
+  };
+
+  socket.onclose = () => {
+    if (!finished) onError?.(new Error("Analysis stream closed"));
+  };
+
+  return () => {
+    finished = true;
+    socket.close();
+  };
+}